@@ -0,0 +1,268 @@
+"""
+Asyncio TCP client for pipelined Proxy RPCs.
+
+This module implements an ``asyncio`` counterpart of ``Client.rpc`` that keeps many
+requests in flight on a single connection. Requests are written as soon as they are
+issued and a single reader task matches each framed response to its awaiting caller
+by request id, so throughput is no longer capped at one request per round trip.
+
+Notes:
+    - Uses the same framing as ``Client``: size header, payload, exec_time trailer.
+    - Running on ``uvloop`` (``uvloop.install()``) is supported but optional.
+"""
+import asyncio
+import collections
+import socket
+import struct
+from typing import Dict
+
+from python.neuro_rpc.Client import ConnectionError, TimeoutError
+from python.neuro_rpc.Logger import Logger
+from python.neuro_rpc.Proxy import Proxy
+from python.neuro_rpc.RPCMethods import RPCMethods
+
+
+class AsyncClient:
+    """
+    Asyncio TCP client with pipelined RPC calls.
+
+    Manages the connection, a background reader task and the table of pending
+    requests awaiting their response.
+    """
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 6363,
+                 endian: str = '>I',
+                 timeout: float = 10.0,
+                 no_delay: bool = True):
+        """
+        Initialize an AsyncClient instance with connection parameters.
+
+        Args:
+            host (str): Target hostname or IP address.
+            port (int): TCP port of the server.
+            endian (str): Struct format for the packet header/trailer (e.g., ``'>I'`` big-endian).
+            timeout (float): Timeout in seconds for connecting and for each RPC.
+            no_delay (bool): If True, disables Nagle’s algorithm and, where available, enables
+                ``TCP_QUICKACK``.
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.no_delay = no_delay
+
+        self.logger = Logger.get_logger(type(self).__name__)
+
+        # Handling methods
+        self.handler = RPCMethods()
+        self._proxy = Proxy()
+
+        self._hdr = struct.Struct(endian)
+        self._trl = struct.Struct(endian)
+
+        self._reader = None
+        self._writer = None
+        self._read_task = None
+        self._quickack_sock = None  # Socket to re-arm TCP_QUICKACK on after each read
+
+        # request id -> (future, hdr_tree); ids kept in send order to pick a decode tree
+        self._pending: Dict[str, tuple] = {}
+        self._order = collections.deque()
+
+    @property
+    def connected(self) -> bool:
+        """bool: True while the connection and its reader task are alive."""
+        return self._read_task is not None and not self._read_task.done()
+
+    async def connect(self) -> None:
+        """
+        Open the connection and start the response reader task.
+
+        Raises:
+            ConnectionError: If the connection cannot be established.
+        """
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Failed to connect to {self.host}:{self.port}: {e}")
+
+        if self.no_delay:
+            sock = self._writer.get_extra_info('socket')
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if hasattr(socket, "TCP_QUICKACK"):  # Linux only
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+                    self._quickack_sock = sock
+
+        self._read_task = asyncio.get_running_loop().create_task(self._read_loop())
+        self.logger.info(f"Connected to server at {self.host}:{self.port}")
+
+    async def disconnect(self) -> None:
+        """
+        Stop the reader task, close the connection and fail any pending RPCs.
+        """
+        if self._read_task is not None:
+            self._read_task.cancel()
+            try:
+                await self._read_task
+            except asyncio.CancelledError:
+                pass
+            self._read_task = None
+
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError as e:
+                self.logger.warning(f"Error during disconnection: {e}")
+            self._writer = None
+            self._reader = None
+            self._quickack_sock = None
+            self.logger.info("Disconnected from server")
+
+        self._fail_pending(ConnectionError("Connection closed"))
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.disconnect()
+
+    async def rpc(self, method, params):
+        """
+        Send an RPC request and await its response.
+
+        Many calls may be awaited concurrently (e.g. with ``asyncio.gather``); they share
+        the connection and are matched to their responses by request id.
+
+        Args:
+            method (str): RPC method name.
+            params (dict): Parameters.
+
+        Returns:
+            tuple[int, dict, int]: ``(size, response_dict, tail)``.
+
+        Raises:
+            ConnectionError: If not connected or the connection drops.
+            TimeoutError: If no response arrives within ``self.timeout``.
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to server. Call connect() first.")
+
+        request = self.handler.create_request(method, params)
+        request_id = request["id"]
+        payload, hdr_tree = self._proxy.to_act(request)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = (future, hdr_tree)
+        self._order.append(request_id)
+
+        self._writer.write(self._hdr.pack(len(payload) + self._trl.size) + payload + self._trl.pack(0))
+        await self._writer.drain()
+
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timed out waiting for response to {request_id}")
+        finally:
+            if self._pending.pop(request_id, None) is not None:
+                self._order.remove(request_id)
+
+    async def echo(self, message='test'):
+        """
+        Send an ``echo`` request and track its execution time.
+
+        Args:
+            message (str): String to send.
+        """
+        if isinstance(message, str):
+            size, data, tail = await self.rpc("echo", {'Message': message})
+
+            self.handler.process_message(data)
+            self.handler.tracker.set_exec_time(data['id'], tail)
+        else:
+            self.logger.error("echo message must be a string")
+
+    async def _read_loop(self) -> None:
+        """
+        Read framed responses and resolve the matching pending futures.
+        """
+        hdr, trl = self._hdr, self._trl
+
+        try:
+            while True:
+                size, = hdr.unpack(await self._reader.readexactly(hdr.size))
+                packet = await self._reader.readexactly(size)
+                data = packet[:size - trl.size]
+                tail, = trl.unpack_from(packet, size - trl.size)
+
+                if self._quickack_sock is not None:  # The kernel clears it again after use
+                    self._quickack_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+                response = self._decode(data)
+                if response is None:  # e.g. a late reply to a request that timed out
+                    self.logger.warning("Dropping response with no pending request")
+                    continue
+
+                request_id = response["id"]
+                future, _ = self._pending.pop(request_id)
+                self._order.remove(request_id)
+                if not future.done():
+                    future.set_result((size, response, tail))
+
+        except asyncio.CancelledError:
+            raise
+        except (asyncio.IncompleteReadError, OSError) as e:
+            self.logger.error(f"Connection lost: {e}")
+            self._fail_pending(ConnectionError(f"Connection error while receiving: {e}"))
+        except Exception as e:
+            self.logger.error(f"Error receiving packet: {e}")
+            self._fail_pending(e)
+
+    def _decode(self, data):
+        """
+        Decode a response with the layout of the pending request it answers.
+
+        In-flight requests may use different layouts (method, message type), so each
+        distinct metadata tree is tried in send order until one decodes to the id of a
+        pending request sharing that tree. A matching id alone is not enough: a wrong
+        tree can still read the id correctly while misreading the message. With
+        responses arriving in order this is one decode.
+
+        Args:
+            data (bytes): Response payload without header and trailer.
+
+        Returns:
+            dict | None: Decoded response, or None if it matches no pending request.
+        """
+        tried = set()
+        for request_id in self._order:
+            hdr_tree = self._pending[request_id][1]
+            if id(hdr_tree) in tried:
+                continue
+            tried.add(id(hdr_tree))
+
+            try:
+                response = self._proxy.from_act(data, hdr_tree)
+            except Exception as e:
+                self.logger.debug(f"Response does not decode with the layout of {request_id}: {e}")
+                continue
+            pending = self._pending.get(response.get("id"))
+            if pending is not None and pending[1] is hdr_tree:
+                return response
+        return None
+
+    def _fail_pending(self, error: Exception) -> None:
+        """
+        Fail every pending RPC with ``error``.
+
+        Args:
+            error (Exception): Exception set on each pending future.
+        """
+        for future, _ in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+        self._order.clear()
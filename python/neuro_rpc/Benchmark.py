@@ -8,17 +8,57 @@ results in multiple formats (JSON, CSV, Excel).
 
 Notes:
     - All time metrics are stored in milliseconds.
-    - Timestamps use both wall-clock (time.time) and high-precision counters (time.perf_counter).
+    - Run timing uses wall-clock time (time.time). Sample timestamps are integer
+      nanoseconds since the run started (time.perf_counter_ns), so latencies are
+      computed without floating-point loss.
+    - pandas is only required for ``data_to_dataframe``; Excel export streams through
+      xlsxwriter when it is installed and falls back to pandas otherwise.
 """
 
+import csv
+import itertools
 import time
 import uuid
-import pandas as pd
-import numpy as np
 import json
 
 from python.neuro_rpc.RPCTracker import RPCTracker
 
+# Bound once at import to skip the attribute lookup on every tracked message
+_perf_counter_ns = time.perf_counter_ns
+
+
+# Field templates copied by Sample/BenchmarkRun (dict.copy() is cheaper than rebuilding the literals)
+_ENTRY_TEMPLATE = {'timestamp': None, 'payload_size': None, 'raw': None}
+_METRICS_TEMPLATE = {'exec_time': 0, 'total_latency': 0, 'network_latency': 0}
+_TIMING_TEMPLATE = {'start_time': None, 'end_time': None, 'duration': None}
+_STATS_TEMPLATE = {'samples_count': 0, 'avg_exec_time': 0, 'avg_total_latency': 0, 'avg_network_latency': 0}
+
+
+def _resolve_raw(entry, encode=False):
+    """
+    Return a request/response entry with its raw message reference serialized.
+
+    Every export goes through this helper, so JSON, CSV, Excel and DataFrame output
+    agree on the same data.
+
+    Args:
+        entry (dict): ``Sample.request`` or ``Sample.response``.
+        encode (bool): If True, emit the raw message as a JSON string for tabular exports.
+
+    Returns:
+        dict: ``entry`` itself, or a copy whose ``raw`` field is the message dict (or its JSON text).
+    """
+    raw = entry['raw']
+    if raw is None:
+        return entry
+    if not isinstance(raw, dict):
+        raw = raw.to_dict()
+    if encode:
+        raw = json.dumps(raw)
+    elif raw is entry['raw']:
+        return entry
+    return {**entry, 'raw': raw}
+
 class Sample:
     """
     Represents a single request-response pair with timing and size metadata.
@@ -33,32 +73,22 @@ class Sample:
 
         All timestamps are initialized to None and metrics to 0.
         """
-        self.request = {
-            'timestamp': None,
-            'payload_size': None,
-            'raw': None
-        }
-        self.response = {
-            'timestamp': None,
-            'payload_size': None,
-            'raw': None
-        }
-        self.metrics = {
-            'exec_time': 0,
-            'total_latency': 0,
-            'network_latency': 0
-        }
+        self.request = _ENTRY_TEMPLATE.copy()
+        self.response = _ENTRY_TEMPLATE.copy()
+        self.metrics = _METRICS_TEMPLATE.copy()
 
     def to_dict(self):
         """
         Serialize the sample to a plain dictionary.
 
+        Raw message references are converted to dictionaries at this point.
+
         Returns:
             dict: A dictionary with ``request``, ``response``, and ``metrics`` fields.
         """
         return {
-            'request': self.request,
-            'response': self.response,
+            'request': _resolve_raw(self.request),
+            'response': _resolve_raw(self.response),
             'metrics': self.metrics
         }
 
@@ -75,34 +105,42 @@ class BenchmarkRun:
         Initialize an empty BenchmarkRun.
 
         Timing fields are None until the run is started; stats are initialized to zero.
+        ``_t0_ns`` is the perf-counter baseline that sample timestamps are relative to,
+        and the ``_sum_*`` accumulators hold running metric totals used for the averages.
         """
-        self.timing = {
-            'start_time': None,
-            'end_time': None,
-            'duration': None
-        }
-        self.stats = {
-            'samples_count': 0,
-            'avg_exec_time': 0,
-            'avg_total_latency': 0,
-            'avg_network_latency': 0
-        }
+        self.timing = _TIMING_TEMPLATE.copy()
+        self.stats = _STATS_TEMPLATE.copy()
         self.samples = {}
+        self._t0_ns = 0
+        self._sum_exec = 0.0
+        self._sum_total = 0.0
+        self._sum_net = 0.0
+
+        # Serialized form, rebuilt only after samples are added or updated
+        self._dict_cache = None
+        self._dirty = True
 
     def to_dict(self):
         """
         Serialize the benchmark run to a dictionary.
 
-        Includes timing, statistics, and all nested samples.
+        Includes timing, statistics, and all nested samples. The result is cached
+        and reused until the run is marked dirty by the tracker.
 
         Returns:
             dict: A dictionary with ``timing``, ``samples`` (serialized), and ``stats``.
         """
-        return {
+        if not self._dirty and self._dict_cache is not None:
+            return self._dict_cache
+
+        # Clear the flag before rebuilding so a concurrent update leaves the cache dirty
+        self._dirty = False
+        self._dict_cache = {
             'timing': self.timing,
             'samples': {k: v.to_dict() for k, v in self.samples.items()},
             'stats': self.stats
         }
+        return self._dict_cache
 
 class Benchmark(RPCTracker):
     """
@@ -163,6 +201,7 @@ class Benchmark(RPCTracker):
         # Create new run
         run = BenchmarkRun()
         run.timing['start_time'] = time.time()
+        run._t0_ns = _perf_counter_ns()
 
         self.data[self.bid] = run
         self._current_run = run
@@ -177,22 +216,28 @@ class Benchmark(RPCTracker):
         Args:
             request: RPCRequest object being sent (must expose ``id``, ``to_json()``, and ``to_dict()``).
             timeout (int): Timeout in seconds associated with the request.
-            raw (bool): If True, store the raw request dict under ``request['raw']``.
+            raw (bool): If True, keep a reference to the request under ``request['raw']``.
+                It is serialized on export, so the request must not be mutated afterwards.
 
         Returns:
             Any: The result of ``RPCTracker.track_outgoing_request``.
         """
         result = super().track_outgoing_request(request, timeout=timeout)
 
-        if self.benchmark_active and request.id is not None:
+        rid = request.id
+        if self.benchmark_active and rid is not None:
+            run = self._current_run
+
             # Create new sample
             sample = Sample()
-            sample.request['timestamp'] = time.perf_counter() * 1000
-            sample.request['payload_size'] = len(request.to_json())
+            sample_request = sample.request
+            sample_request['timestamp'] = _perf_counter_ns() - run._t0_ns
+            sample_request['payload_size'] = len(request.to_json())
             if raw:
-                sample.request['raw'] = request.to_dict()
+                sample_request['raw'] = request
 
-            self._current_run.samples[request.id] = sample
+            run.samples[rid] = sample
+            run._dirty = True
 
         return result
 
@@ -203,26 +248,39 @@ class Benchmark(RPCTracker):
         Args:
             response: RPCResponse object being received (must expose ``id``, ``to_json()``,
                 ``to_dict()``, and ``exec_time`` in microseconds).
-            raw (bool): If True, store the raw response dict under ``response['raw']``.
+            raw (bool): If True, keep a reference to the response under ``response['raw']``.
+                It is serialized on export, so the response must not be mutated afterwards.
 
         Returns:
             Any: The result of ``RPCTracker.track_incoming_response``.
         """
         result = super().track_incoming_response(response)
 
-        if self.benchmark_active and response.id is not None and response.id in self._current_run.samples:
-            sample = self._current_run.samples[response.id]
-            sample.response['timestamp'] = time.perf_counter() * 1000
-            sample.response['payload_size'] = len(response.to_json())
+        rid = response.id
+        run = self._current_run
+        sample = run.samples.get(rid) if (self.benchmark_active and rid is not None) else None
+        if sample is not None:
+            timestamp = _perf_counter_ns() - run._t0_ns
+            sample_response = sample.response
+            sample_response['timestamp'] = timestamp
+            sample_response['payload_size'] = len(response.to_json())
             if raw:
-                sample.response['raw'] = response.to_dict()
+                sample_response['raw'] = response
 
-            sample.metrics['exec_time'] = response.exec_time / 1000  # Convert μs → ms
+            exec_time = response.exec_time / 1000  # Convert μs → ms
             # Calculate latencies
-            sample.metrics['total_latency'] = sample.response['timestamp'] - sample.request['timestamp']
-            sample.metrics['network_latency'] = abs(
-                sample.metrics['total_latency'] - sample.metrics['exec_time']
-            )
+            total_latency = (timestamp - sample.request['timestamp']) / 1e6  # ns → ms
+            network_latency = abs(total_latency - exec_time)
+
+            # Keep running sums so stop_benchmark does not rescan every sample
+            metrics = sample.metrics
+            run._sum_exec += exec_time - metrics['exec_time']
+            run._sum_total += total_latency - metrics['total_latency']
+            run._sum_net += network_latency - metrics['network_latency']
+            metrics['exec_time'] = exec_time
+            metrics['total_latency'] = total_latency
+            metrics['network_latency'] = network_latency
+            run._dirty = True
 
         return result
 
@@ -234,12 +292,18 @@ class Benchmark(RPCTracker):
             response_id (str): ID of the response sample.
             exec_time (float): Execution time in microseconds (μs). Internally converted to milliseconds (ms).
         """
-        if self.benchmark_active and response_id in self._current_run.samples:
-            sample = self._current_run.samples[response_id]
-            sample.metrics['exec_time'] = exec_time / 1000
-            sample.metrics['network_latency'] = abs(
-                sample.metrics['total_latency'] - sample.metrics['exec_time']
-            )
+        run = self._current_run
+        sample = run.samples.get(response_id) if self.benchmark_active else None
+        if sample is not None:
+            exec_time = exec_time / 1000
+            metrics = sample.metrics
+            network_latency = abs(metrics['total_latency'] - exec_time)
+
+            run._sum_exec += exec_time - metrics['exec_time']
+            run._sum_net += network_latency - metrics['network_latency']
+            metrics['exec_time'] = exec_time
+            metrics['network_latency'] = network_latency
+            run._dirty = True
 
     def stop_benchmark(self, benchmark_id=None):
         """
@@ -257,14 +321,15 @@ class Benchmark(RPCTracker):
         run.timing['end_time'] = time.time()
         run.timing['duration'] = run.timing['end_time'] - run.timing['start_time']
 
-        # Calculate statistics
-        samples = run.samples.values()
+        # Calculate statistics from the running sums (unanswered samples count as zero)
+        n = len(run.samples)
         run.stats.update({
-            'samples_count': len(samples),
-            'avg_exec_time': np.mean([s.metrics['exec_time'] for s in samples]),
-            'avg_total_latency': np.mean([s.metrics['total_latency'] for s in samples]),
-            'avg_network_latency': np.mean([s.metrics['network_latency'] for s in samples])
+            'samples_count': n,
+            'avg_exec_time': run._sum_exec / n if n else float('nan'),
+            'avg_total_latency': run._sum_total / n if n else float('nan'),
+            'avg_network_latency': run._sum_net / n if n else float('nan')
         })
+        run._dirty = True
 
         self.benchmark_active = False
         self._current_run = None
@@ -275,37 +340,111 @@ class Benchmark(RPCTracker):
         Convert all benchmark data into a Pandas DataFrame.
 
         Each row corresponds to a sample with benchmark ID, timing, request/response,
-        metrics, and run statistics.
+        metrics, and run statistics. Rows and columns are the same as in the CSV export;
+        raw request/response messages are kept as JSON strings in ``request_raw`` and
+        ``response_raw``.
 
         Returns:
             pandas.DataFrame: A flattened (normalized) table of benchmark data.
+
+        Notes:
+            pandas is imported on first use so live tracking does not pay its import cost.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self._iter_rows(), columns=self._columns())
+
+    @staticmethod
+    def _columns():
+        """
+        Build the flat column names used for tabular exports.
+
+        Returns:
+            list[str]: Column names, matching the ``<group>_<field>`` layout of ``data_to_dataframe``.
+        """
+        run, sample = BenchmarkRun(), Sample()
+        return [
+            'benchmark_id', 'sample_id',
+            *(f"timing_{k}" for k in run.timing),
+            *(f"request_{k}" for k in sample.request),
+            *(f"response_{k}" for k in sample.response),
+            *(f"metrics_{k}" for k in sample.metrics),
+            *(f"stats_{k}" for k in run.stats)
+        ]
+
+    def _iter_rows(self):
         """
-        data_rows = []
+        Lazily generate one flat row per sample, in ``_columns()`` order.
 
+        This is the single row source for the DataFrame, CSV and Excel exports.
+        Raw request/response messages are emitted as JSON strings.
+
+        Yields:
+            tuple: A single sample row.
+        """
         for bid, run in self.data.items():
+            timing = tuple(run.timing.values())
+            stats = tuple(run.stats.values())
             for sample_id, sample in run.samples.items():
-                row = {
-                    'benchmark_id': bid,
-                    'sample_id': sample_id,
-                    'timing': run.timing,
-                    'request': sample.request,
-                    'response': sample.response,
-                    'metrics': sample.metrics,
-                    'stats': run.stats
-                }
-                data_rows.append(row)
-
-        # Convert to DataFrame
-        df = pd.json_normalize(data_rows, sep='_')
-        return df
-
-    def export(self, format='json', filename=None):
+                yield (
+                    bid, sample_id, *timing,
+                    *_resolve_raw(sample.request, encode=True).values(),
+                    *_resolve_raw(sample.response, encode=True).values(),
+                    *sample.metrics.values(),
+                    *stats
+                )
+
+    def _stream_csv(self, path, chunk_size=65536):
+        """
+        Stream all samples to a CSV file without materializing a DataFrame.
+
+        Rows are written in blocks of ``chunk_size``, so peak memory is bounded
+        by one block instead of the whole dataset.
+
+        Args:
+            path (str): Destination file path.
+            chunk_size (int): Number of rows written per block.
+        """
+        rows = self._iter_rows()
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self._columns())
+            while True:
+                block = list(itertools.islice(rows, chunk_size))
+                if not block:
+                    break
+                writer.writerows(block)
+
+    def _stream_excel(self, path):
+        """
+        Stream all samples to an Excel workbook.
+
+        Uses xlsxwriter in ``constant_memory`` mode, writing rows as they are generated.
+        Falls back to ``data_to_dataframe().to_excel`` when xlsxwriter is not installed.
+
+        Args:
+            path (str): Destination file path.
+        """
+        try:
+            import xlsxwriter
+        except ImportError:
+            self.data_to_dataframe().to_excel(path, index=False)
+            return
+
+        with xlsxwriter.Workbook(path, {'constant_memory': True}) as workbook:
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, self._columns())
+            for r, row in enumerate(self._iter_rows(), start=1):
+                worksheet.write_row(r, 0, row)
+
+    def export(self, format='json', filename=None, chunk_size=65536):
         """
         Export benchmark results to disk.
 
         Args:
             format (str): File format. One of ``'json'``, ``'csv'``, or ``'excel'``.
             filename (str | None): Optional base filename. Defaults to ``'benchmark_<id>'``.
+            chunk_size (int): Rows written per block for CSV export.
 
         Returns:
             bool: True if export succeeded.
@@ -321,12 +460,10 @@ class Benchmark(RPCTracker):
             }
             with open(f"{filename}.json", 'w') as f:
                 json.dump(serializable_data, f, indent=2)
-        else:
-            df = self.data_to_dataframe()
-            if format.lower() == 'csv':
-                df.to_csv(f"{filename}.csv", index=False)
-            elif format.lower() == 'excel':
-                df.to_excel(f"{filename}.xlsx", index=False)
+        elif format.lower() == 'csv':
+            self._stream_csv(f"{filename}.csv", chunk_size=chunk_size)
+        elif format.lower() == 'excel':
+            self._stream_excel(f"{filename}.xlsx")
 
         self.logger.info(f"Benchmark metadata exported to {filename}.{format}")
         return True
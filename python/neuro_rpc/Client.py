@@ -9,15 +9,84 @@ Notes:
     - All socket operations are blocking.
     - Background operation is achieved by running the client in a thread.
 """
+import codecs
+import contextlib
+import ctypes
+import functools
+import json
+import os
+import queue
+import select
 import socket
 import struct
+import sys
 import threading
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+import msgpack
+import numpy as np
 
 from python.neuro_rpc.Logger import Logger
 from python.neuro_rpc.RPCMethods import RPCMethods
-from python.neuro_rpc.Proxy import *
+from python.neuro_rpc.Proxy import Proxy
+from python.neuro_rpc._json_encoders import NpEncoder, dumps as _dumps
+from python.neuro_rpc.RPCMessage import RPCRequest
+
+
+# Prefer orjson for the JSON wire format; _dumps (from _json_encoders) and _loads both
+# produce/consume UTF-8 bytes
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _loads(data):
+        # json.loads takes bytes/bytearray and decodes them in C; only views need a copy
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+def _msgpack_default(obj):
+    """Convert NumPy values for msgpack, mirroring ``NpEncoder``."""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+_msgpack_packb = functools.partial(msgpack.packb, use_bin_type=True, default=_msgpack_default)
+_msgpack_unpackb = functools.partial(msgpack.unpackb, raw=False)
+
+SERIALIZERS = ('json', 'msgpack')
+
+# Socket buffers sized well above the largest echo frame (~9.6 KB)
+DEFAULT_SOCKET_OPTIONS = [
+    (socket.SOL_SOCKET, socket.SO_SNDBUF, 65536),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, 65536),
+]
+
+# Payload sizes used by echo_benchmark: 0 to 9600 bytes in 21 steps of 480
+ECHO_SIZES = tuple(range(0, 9601, 480))
+
+# Let the kernel fill short reads in one call where TCP supports it (not Windows). Only
+# blocking sockets honor it: with a timeout, Python makes the socket non-blocking and
+# the read still returns short
+_MSG_WAITALL = 0 if sys.platform == "win32" else getattr(socket, "MSG_WAITALL", 0)
+
+
+# Scatter-gather sends (not available on Windows)
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+# Above this body size send_message avoids concatenating the size prefix and body
+_SENDMSG_THRESHOLD = 64 * 1024
+
+# Busy-poll receive path: non-blocking reads, falling back to select() after this many misses
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+_BUSY_POLL_SPINS = 1000
+# Not exported by every Python build; 46 is the Linux value
+_SO_BUSY_POLL = getattr(socket, "SO_BUSY_POLL", 46 if sys.platform.startswith("linux") else None)
 
 
 class ConnectionError(Exception):
@@ -34,7 +103,66 @@ class MessageError(Exception):
     """Raised when a message cannot be serialized, sent, or parsed."""
     pass
 
-import subprocess
+
+# Windows ignores IP_TOS; DSCP marking goes through the QoS2 (qWAVE) flow API instead
+_QOS_TRAFFIC_TYPE_VOICE = 4
+_QOS_NON_ADAPTIVE_FLOW = 0x00000002
+_QOS_SET_OUTGOING_DSCP_VALUE = 2
+
+
+class _QosVersion(ctypes.Structure):
+    _fields_ = [("MajorVersion", ctypes.c_ushort), ("MinorVersion", ctypes.c_ushort)]
+
+
+def _qos_add_socket(sock: socket.socket, dscp: int = 46):
+    """
+    Add a connected socket to a qWAVE voice flow and request DSCP ``dscp`` (Windows only).
+
+    Args:
+        sock (socket.socket): Connected socket.
+        dscp (int): DSCP value for outgoing packets (46 = EF).
+
+    Returns:
+        tuple[ctypes.c_void_p, ctypes.c_uint32]: QoS handle and flow id, for ``_qos_remove_socket``.
+
+    Raises:
+        OSError: If the flow cannot be created.
+    """
+    qwave = ctypes.WinDLL("qwave", use_last_error=True)
+    handle = ctypes.c_void_p()
+    flow_id = ctypes.c_uint32(0)
+
+    if not qwave.QOSCreateHandle(ctypes.byref(_QosVersion(1, 0)), ctypes.byref(handle)):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    if not qwave.QOSAddSocketToFlow(handle, ctypes.c_size_t(sock.fileno()), None,
+                                    _QOS_TRAFFIC_TYPE_VOICE, _QOS_NON_ADAPTIVE_FLOW,
+                                    ctypes.byref(flow_id)):
+        error = ctypes.get_last_error()
+        qwave.QOSCloseHandle(handle)
+        raise ctypes.WinError(error)
+
+    # Exact DSCP needs admin rights; the voice traffic type alone still marks the flow
+    value = ctypes.c_uint32(dscp)
+    qwave.QOSSetFlow(handle, flow_id, _QOS_SET_OUTGOING_DSCP_VALUE,
+                     ctypes.sizeof(value), ctypes.byref(value), 0, None)
+
+    return handle, flow_id
+
+
+def _qos_remove_socket(sock: socket.socket, qos) -> None:
+    """
+    Release a flow created by ``_qos_add_socket``.
+
+    Args:
+        sock (socket.socket): Socket in the flow.
+        qos (tuple): Handle and flow id returned by ``_qos_add_socket``.
+    """
+    handle, flow_id = qos
+    qwave = ctypes.WinDLL("qwave", use_last_error=True)
+    qwave.QOSRemoveSocketFromFlow(handle, ctypes.c_size_t(sock.fileno()), flow_id, 0)
+    qwave.QOSCloseHandle(handle)
+
 
 class Client:
     """
@@ -52,7 +180,14 @@ class Client:
                  max_retries: int = 3,
                  retry_delay: float = 1.0,
                  handler=None,
-                 no_delay = True):
+                 no_delay = True,
+                 socket_options: Optional[List[Tuple[int, int, int]]] = None,
+                 sndbuf: Optional[int] = None,
+                 rcvbuf: Optional[int] = None,
+                 busy_poll: bool = False,
+                 busy_poll_us: int = 50,
+                 cpu_affinity: Optional[int] = None,
+                 serializer: str = 'json'):
         """
         Initialize a Client instance with connection parameters.
 
@@ -60,34 +195,91 @@ class Client:
             host (str): Target hostname or IP address.
             port (int): TCP port of the server.
             encoding (str): Encoding for JSON messages.
-            endian (str): Struct format for message length (e.g., ``'>I'`` big-endian).
-            timeout (float): Socket timeout in seconds.
+            endian (str): Struct format for message lengths and packet header/trailer (e.g., ``'>I'`` big-endian).
+            timeout (float | None): Socket timeout in seconds. ``None`` makes the socket
+                blocking, which lets receives complete in a single ``MSG_WAITALL`` read.
             max_retries (int): Maximum number of connection attempts.
             retry_delay (float): Delay between retry attempts in seconds.
             handler: Optional RPC handler, defaults to ``RPCMethods()``.
-            no_delay (bool): If True, disables Nagle’s algorithm and sets DSCP EF.
+            no_delay (bool): If True, disables Nagle’s algorithm, sets DSCP EF and, where
+                available, enables ``TCP_QUICKACK``.
+            socket_options (list[tuple[int, int, int]] | None): ``(level, option, value)``
+                triples applied with ``setsockopt`` before connecting. Defaults to
+                ``DEFAULT_SOCKET_OPTIONS``.
+            sndbuf (int | None): ``SO_SNDBUF`` size in bytes, overriding ``socket_options``
+                (e.g. ``4 << 20`` for high-throughput links).
+            rcvbuf (int | None): ``SO_RCVBUF`` size in bytes, overriding ``socket_options``.
+            busy_poll (bool): If True, receives spin on non-blocking reads instead of sleeping
+                in the kernel, trading CPU for wake-up latency. Requires ``MSG_DONTWAIT``.
+            busy_poll_us (int): ``SO_BUSY_POLL`` value in microseconds (Linux only).
+            cpu_affinity (int | None): CPU to pin the background client thread to (Linux only).
+                Pair it with the NIC IRQ affinity (``/proc/irq/*/smp_affinity``) so packet RX,
+                socket state and the client code share the same core caches.
+            serializer (str): Wire format for ``send_message``/``receive_message`` and dict
+                packets, ``'json'`` or ``'msgpack'``. Both ends must agree; Proxy RPCs are
+                unaffected.
+
+        Raises:
+            ValueError: If ``serializer`` is not supported.
         """
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unsupported serializer '{serializer}', expected one of {SERIALIZERS}")
+
         self.host = host
         self.port = port
         self.encoding = encoding
+        self.serializer = serializer
+        if serializer == 'msgpack':
+            self._encode, self._decode = _msgpack_packb, _msgpack_unpackb
+        elif codecs.lookup(encoding).name == 'utf-8':
+            self._encode, self._decode = _dumps, _loads
+        else:
+            self._encode, self._decode = self._encode_json, self._decode_json
         self.endian = endian
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.no_delay = no_delay
+        self.socket_options = list(DEFAULT_SOCKET_OPTIONS if socket_options is None else socket_options)
+        # Applied after the others, so these take precedence
+        if sndbuf is not None:
+            self.socket_options.append((socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf))
+        if rcvbuf is not None:
+            self.socket_options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf))
+        self._quickack = False
+        self.busy_poll = busy_poll and bool(_MSG_DONTWAIT)
+        self.busy_poll_us = busy_poll_us
+        self.cpu_affinity = cpu_affinity
 
         self.client = None
         self.client_thread = None
         self.connected = False
+        self._sock = None  # Connected socket, or None; checked once per send/receive
+        self._qos = None  # qWAVE flow of the socket (Windows only)
         self.thread_running = False
+        self._stop_event = threading.Event()
+        self._wake_w = None  # Write end of the supervisor's wake-up socketpair
+        # Held for each request/response exchange and while self.client is replaced
+        self._io_lock = threading.RLock()
 
-        self.logger = Logger.get_logger(self.__class__.__name__())
+        self.logger = Logger.get_logger(type(self).__name__)
 
         # Handling methods
         self.handler = RPCMethods()
 
-        self.header_bytes = 4
-        self.trailer_bytes = 4
+        # Proxy keeps no per-call state (hdr_tree is returned by to_act), so one instance serves every RPC
+        self._proxy = Proxy()
+
+        # Precompiled packers for the size prefix of messages/packets and the packet trailer (exec_time)
+        self._hdr = struct.Struct(endian)
+        self._trl = struct.Struct(endian)
+
+        # Field widths follow the configured format so framing and packing always agree
+        self.header_bytes = self._hdr.size
+        self.trailer_bytes = self._trl.size
+
+        # Scratch buffer reused by every receive, grown to the high-water mark
+        self._recv_buf = bytearray(65536)
 
     def start(self):
         """
@@ -100,17 +292,19 @@ class Client:
             self.logger.error(f"Client is already running in thread {self.client_thread.name}")
             return
 
+        self._stop_event.clear()
+
         # Start the client in a separate thread
         def client_thread_func():
             try:
-                self.logger.debug(f"Starting client on thread {threading.current_thread().name}")
+                self.logger.debug("Starting client on thread %s", threading.current_thread().name)
+                if self.cpu_affinity is not None:
+                    self._pin_thread(self.cpu_affinity)
                 self.connect()
                 self.thread_running = True
 
-                # Main thread loop
-                while self.thread_running:
-                    # TODO: handle reconnection logic here
-                    time.sleep(0.1)  # Prevent CPU hogging
+                # Block until stop() is called, reconnecting if the server drops us
+                self._supervise()
 
             except Exception as e:
                 self.logger.error(f"Client error: {e}")
@@ -127,6 +321,98 @@ class Client:
         self.client_thread.start()
         self.logger.debug("Client started in background thread")
 
+    def _supervise(self) -> None:
+        """
+        Wait until ``stop()`` is called, reconnecting whenever the connection is lost.
+
+        The thread blocks on a wake-up socketpair and uses no CPU while idle. It is woken
+        by ``stop()`` or by ``_connection_lost()``, which the send/receive paths call
+        when the server closes or resets the connection. The RPC socket itself is never
+        watched here, so responses are read only by the RPC caller.
+        """
+        wake_r, self._wake_w = socket.socketpair()
+
+        try:
+            while not self._stop_event.is_set():
+                if self.client is not None and not self.connected:
+                    self.logger.warning("Connection lost, reconnecting...")
+                    self._reconnect()
+                    continue
+                wake_r.recv(64)
+        finally:
+            wake_w, self._wake_w = self._wake_w, None
+            wake_r.close()
+            wake_w.close()
+
+    def _wake_supervisor(self) -> None:
+        """
+        Wake the supervisor thread, if it is running.
+        """
+        wake_w = self._wake_w
+        if wake_w is not None:
+            try:
+                wake_w.send(b'\0')
+            except OSError:
+                pass
+
+    def _connection_lost(self) -> None:
+        """
+        Mark the connection as lost and let the supervisor reconnect.
+
+        ``self.client`` is kept so the supervisor can tell a dropped connection from a
+        deliberate ``disconnect()``; ``connect()`` closes it.
+        """
+        self.connected = False
+        self._sock = None
+        self._wake_supervisor()
+
+    def _lost_on(self, error: Exception) -> None:
+        """
+        Call ``_connection_lost()`` if ``error`` means the connection is gone.
+
+        Args:
+            error (Exception): Error raised by a send or receive.
+        """
+        if isinstance(error, OSError) and not isinstance(error, socket.timeout):
+            self._connection_lost()
+
+    def _reconnect(self) -> None:
+        """
+        Reconnect with exponential backoff until connected or ``stop()`` is called.
+
+        Each attempt holds the I/O lock, so no RPC runs on the socket being replaced.
+        """
+        backoff = self.retry_delay
+
+        while not self._stop_event.is_set():
+            with self._io_lock:
+                if self.client is None or self.connected:
+                    return  # Disconnected on purpose, or reconnected by a caller
+                try:
+                    self.connect()
+                    return
+                except ConnectionError:
+                    pass
+            self._stop_event.wait(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def _pin_thread(self, cpu: int) -> None:
+        """
+        Pin the calling thread to a single CPU.
+
+        Args:
+            cpu (int): CPU index.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            self.logger.warning("CPU affinity is not supported on this platform")
+            return
+
+        try:
+            os.sched_setaffinity(0, {cpu})  # 0 = calling thread on Linux
+            self.logger.debug("Client thread pinned to CPU %s", cpu)
+        except OSError as e:
+            self.logger.warning(f"Could not pin client thread to CPU {cpu}: {e}")
+
     def stop(self):
         """
         Stop the client thread and disconnect.
@@ -139,6 +425,8 @@ class Client:
 
         self.logger.info("Stopping client...")
         try:
+            self._stop_event.set()
+            self._wake_supervisor()
             self.disconnect()
 
             # Stop monitor tracker
@@ -159,6 +447,22 @@ class Client:
         """
         Establish a TCP connection with retry support.
 
+        Args:
+            retry (bool): Whether to retry failed attempts.
+
+        Returns:
+            bool: True if connected successfully.
+
+        Raises:
+            ConnectionError: If all attempts fail.
+        """
+        with self._io_lock:
+            return self._connect(retry)
+
+    def _connect(self, retry: bool) -> bool:
+        """
+        Body of ``connect()``; the caller holds the I/O lock.
+
         Args:
             retry (bool): Whether to retry failed attempts.
 
@@ -177,21 +481,34 @@ class Client:
 
                 self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
+                for level, option, value in self.socket_options:
+                    self.client.setsockopt(level, option, value)
+
                 if self.no_delay:
                     self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                     self.client.setsockopt(socket.IPPROTO_IP , socket.IP_TOS, 46 << 2)  # Set TOS for low latency
                     #self.client.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_TCLASS, 0xB8)
                     self.logger.debug("Nagle's algorithm disabled for better latency. TOS set to EF.")
 
-                    '''try:
-                        create_qos_policy_on_port(self.port)
-                        self.logger.debug("QoS2 DSCP EF applied via QOSAddSocketToFlow/QOSSetFlow2")
-                    except Exception as e:
-                        self.logger.warning(f"QoS2 setup failed: {e}")'''
-
                 self.client.settimeout(self.timeout)
                 self.client.connect((self.host, self.port))
                 self.connected = True
+                self._sock = self.client
+
+                if self.no_delay and sys.platform == "win32":
+                    try:
+                        self._qos = _qos_add_socket(self.client)
+                        self.logger.debug("QoS2 DSCP EF applied via QOSAddSocketToFlow/QOSSetFlow")
+                    except (OSError, AttributeError) as e:
+                        self.logger.warning(f"QoS2 setup failed: {e}")
+
+                if self.busy_poll:
+                    self._enable_busy_poll()
+
+                # Linux only; delayed ACKs otherwise add to every small round trip
+                self._quickack = self.no_delay and hasattr(socket, "TCP_QUICKACK")
+                if self._quickack:
+                    self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
                 self.logger.info(f"Connected to server at {self.host}:{self.port}")
 
                 return True
@@ -204,25 +521,55 @@ class Client:
                     self.logger.error(f"Failed to connect after {attempts} attempts: {e}")
                     self.client = None
                     self.connected = False
+                    self._sock = None
                     raise ConnectionError(f"Failed to connect to {self.host}:{self.port}: {e}")
 
         return False
 
+    def _enable_busy_poll(self) -> None:
+        """
+        Switch the connected socket to the busy-poll receive mode.
+
+        The socket is made blocking so ``MSG_DONTWAIT`` reads return immediately instead
+        of waiting in ``select``; ``_recv_exactly`` enforces ``self.timeout`` itself.
+        """
+        self.client.settimeout(None)
+
+        if _SO_BUSY_POLL is not None:
+            try:
+                self.client.setsockopt(socket.SOL_SOCKET, _SO_BUSY_POLL, self.busy_poll_us)
+            except OSError as e:
+                self.logger.warning(f"SO_BUSY_POLL not applied: {e}")
+
+        self.logger.debug("Busy-poll receive mode enabled.")
+
     def disconnect(self) -> None:
         """
         Close the TCP connection.
 
         Notes:
-            Resets the socket and updates state to disconnected.
+            Resets the socket and updates state to disconnected. Waits for an RPC in
+            progress on another thread to finish first.
+        """
+        with self._io_lock:
+            self._disconnect()
+
+    def _disconnect(self) -> None:
+        """
+        Body of ``disconnect()``; the caller holds the I/O lock.
         """
         if self.client:
             try:
+                if self._qos is not None:
+                    _qos_remove_socket(self.client, self._qos)
+                    self._qos = None
                 self.client.close()
             except socket.error as e:
                 self.logger.warning(f"Error during disconnection: {e}")
             finally:
                 self.client = None
                 self.connected = False
+                self._sock = None
                 self.logger.info("Disconnected from server")
 
     def ensure_connected(self) -> None:
@@ -235,36 +582,54 @@ class Client:
         if not self.connected or self.client is None:
             raise ConnectionError("Not connected to server. Call connect() first.")
 
+    def _encode_json(self, message) -> bytes:
+        """JSON-encode ``message`` with a non-UTF-8 ``self.encoding``."""
+        return json.dumps(message, cls=NpEncoder).encode(self.encoding)
+
+    def _decode_json(self, data):
+        """Parse JSON received with a non-UTF-8 ``self.encoding``."""
+        return json.loads(str(data, self.encoding))
+
     def _build_packet(self, data, tail = 0):
         """
         Build a framed packet with header, payload, and trailer.
 
         Args:
-            data (dict | str | bytes): Payload data.
+            data (dict | str | bytes | bytearray | memoryview): Payload data.
             tail (int): Optional trailer integer.
 
         Returns:
-            bytes: Complete packet ready to send.
+            bytearray: Complete packet ready to send.
 
         Raises:
-            TypeError: If ``data`` is not ``str`` or ``bytes`` after JSON serialization for ``dict``.
+            TypeError: If ``data`` is not a dict, a string or a bytes-like object.
         """
-        # TODO: Check endianess
-        if isinstance(data, dict):
-            data = json.dumps(data)
+        # Single exact-type dispatch; flattened RPC requests (bytes) take the first branch
+        t = type(data)
+        if t is bytes or t is bytearray or t is memoryview:
+            pass
+        elif t is str:
+            data = data.encode(self.encoding)
+        elif t is dict:
+            data = self._encode(data)
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            pass
+        elif isinstance(data, str):
+            data = data.encode(self.encoding)
+        elif isinstance(data, dict):
+            data = self._encode(data)
+        else:
+            raise TypeError('data must be dict, str or bytes-like')
 
-        header = (len(data) + self.trailer_bytes).to_bytes(self.header_bytes)
-        trailer = tail.to_bytes(self.trailer_bytes)
+        # 4 bytes header + n bytes payload + 4 bytes tail, written in place into one buffer
+        n = len(data)
+        start = self.header_bytes
+        end = start + n
 
-        packet = bytearray()
-        packet.extend(header)                       # 4 bytes header
-        if isinstance(data, str):
-            packet.extend(data.encode(self.encoding))   # n bytes payload
-        elif isinstance(data, bytes):
-            packet.extend(data)
-        else:
-            raise TypeError('data must be str or bytes')
-        packet.extend(trailer)                      # 4 bytes tail
+        packet = bytearray(end + self.trailer_bytes)
+        self._hdr.pack_into(packet, 0, n + self.trailer_bytes)
+        packet[start:end] = data
+        self._trl.pack_into(packet, end, tail)
         return packet
 
     def _unbuild_packet(self, packet, size: int):
@@ -272,14 +637,14 @@ class Client:
         Parse a framed packet into payload and trailer.
 
         Args:
-            packet (bytes): Raw packet.
+            packet (bytes | memoryview): Raw packet.
             size (int): Declared size.
 
         Returns:
-            tuple[bytes, int]: Payload bytes and trailer integer.
+            tuple[bytes | memoryview, int]: Payload and trailer integer.
         """
         data = packet[:size-self.trailer_bytes]
-        tail = int.from_bytes(packet[-self.trailer_bytes:])
+        tail, = self._trl.unpack_from(packet, size - self.trailer_bytes)
         return data, tail
 
     def send_message(self,
@@ -299,26 +664,36 @@ class Client:
             ConnectionError: If not connected.
             MessageError: If serialization or send fails.
         """
-        self.ensure_connected()
+        if self._sock is None:
+            raise ConnectionError("Not connected to server. Call connect() first.")
 
         attempts = 1 if not retry_on_error else self.max_retries
 
-        for attempt in range(1, attempts + 1):
-            try:
-                # Serialize message as JSON
-                message_json = json.dumps(message)
+        # Serialize once; retries only repeat the send
+        body = self._encode(message)
 
-                # Send the size of the message first
-                message_size = len(message_json)
-                self.client.sendall(struct.pack(self.endian, message_size))
+        try:
+            header = self._hdr.pack(len(body))
+        except struct.error as e:
+            self.logger.error(f"Failed to frame message: {e}")
+            raise MessageError(f"Failed to send message: {e}")
 
-                # Send the actual message
-                self.client.sendall(message_json.encode(self.encoding))
+        # Large bodies go out by scatter-gather instead of being copied behind the header
+        scatter = _HAS_SENDMSG and len(body) > _SENDMSG_THRESHOLD
+        packet = (header, body) if scatter else header + body
+
+        for attempt in range(1, attempts + 1):
+            try:
+                # Send the size prefix and the message in a single call
+                if scatter:
+                    self._sendmsg_all(packet)
+                else:
+                    self.client.sendall(packet)
 
                 #self.logger.debug(f"Sent: {message}")
                 return True
 
-            except (socket.error, struct.error) as e:
+            except socket.error as e:
                 if attempt < attempts:
                     self.logger.warning(f"Send attempt {attempt} failed: {e}. Retrying...")
                     # Try to reconnect before retrying
@@ -350,7 +725,8 @@ class Client:
             TimeoutError: If operation times out.
             MessageError: If parsing fails.
         """
-        self.ensure_connected()
+        if self._sock is None:
+            raise ConnectionError("Not connected to server. Call connect() first.")
 
         # Set timeout for this operation if provided
         original_timeout = None
@@ -360,10 +736,10 @@ class Client:
 
         try:
             # Read the message size
-            message_size_data = self._recv_exactly(4)
+            message_size_data = self._recv_exactly(self._hdr.size)
 
             # Unpack the message size
-            message_size = struct.unpack(self.endian, message_size_data)[0]
+            message_size = self._hdr.unpack(message_size_data)[0]
 
             # Set partial timeout for remainder of message if specified
             if partial_timeout is not None and original_timeout is None:
@@ -374,7 +750,7 @@ class Client:
             message_data = self._recv_exactly(message_size)
 
             # Decode and parse the message
-            response = json.loads(message_data.decode(self.encoding))
+            response = self._decode(message_data)
             return response
 
         except socket.timeout as e:
@@ -383,10 +759,10 @@ class Client:
 
         except socket.error as e:
             self.logger.error(f"Socket error: {e}")
-            self.connected = False  # Mark as disconnected since the connection probably dropped
+            self._connection_lost()  # The connection probably dropped
             raise ConnectionError(f"Connection error while receiving: {e}")
 
-        except (struct.error, json.JSONDecodeError) as e:
+        except (struct.error, ValueError) as e:  # JSONDecodeError and msgpack errors are ValueErrors
             self.logger.error(f"Error parsing message: {e}")
             raise MessageError(f"Invalid message format: {e}")
 
@@ -395,42 +771,104 @@ class Client:
             if original_timeout is not None:
                 self.client.settimeout(original_timeout)
 
-    def _recv_exactly(self, n: int) -> bytes:
+    def _recv_exactly(self, n: int) -> memoryview:
         """
         Receive exactly ``n`` bytes.
 
+        Reads directly into the client's reusable receive buffer, so steady-state
+        traffic does not allocate a new buffer per message. The buffer is replaced
+        by a larger one whenever ``n`` exceeds its current size.
+
         Args:
             n (int): Number of bytes expected.
 
         Returns:
-            bytes: Data read.
+            memoryview: View over the data read. It is only valid until the next
+            receive on this client; copy it (``bytes(view)``) to keep it longer.
+
+        Raises:
+            ConnectionError: If socket closed before receiving. The supervisor thread, if
+                running, is told to reconnect.
+        """
+        if len(self._recv_buf) < n:
+            # Replace rather than resize: views handed out earlier may still be alive
+            self._recv_buf = bytearray(n)
+
+        view = memoryview(self._recv_buf)[:n]
+
+        try:
+            if self.busy_poll:
+                self._spin_into(view, n)
+            else:
+                # On a blocking socket MSG_WAITALL fills the view in one read; the loop
+                # finishes short reads (signals, or a socket with a timeout)
+                flags = _MSG_WAITALL if self.client.gettimeout() is None else 0
+                received = self.client.recv_into(view, n, flags) if n else 0
+                if n and not received:  # Connection closed
+                    raise ConnectionError("Connection closed by server")
+
+                while received < n:
+                    count = self.client.recv_into(view[received:])
+                    if not count:  # Connection closed
+                        raise ConnectionError("Connection closed by server")
+                    received += count
+        except socket.timeout:
+            raise
+        except (ConnectionError, OSError):
+            self._connection_lost()
+            raise
+
+        if self._quickack:  # The kernel clears it again after use
+            self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+        return view
+
+    def _spin_into(self, view: memoryview, n: int) -> None:
+        """
+        Fill ``view`` with ``n`` bytes by spinning on non-blocking reads.
+
+        After ``_BUSY_POLL_SPINS`` consecutive empty reads it waits in ``select`` so an
+        idle connection does not keep a core at 100%.
+
+        Args:
+            view (memoryview): Destination buffer.
+            n (int): Number of bytes expected.
 
         Raises:
             ConnectionError: If socket closed before receiving.
+            socket.timeout: If no data arrives within ``self.timeout``.
         """
-        data = b''
-        remaining = n
+        sock = self.client
+        received = 0
+        misses = 0
 
-        while remaining > 0:
-            chunk = self.client.recv(remaining)
-            # self.logger.info(f"Received chunk: {chunk}")
-            if not chunk:  # Connection closed
+        while received < n:
+            try:
+                count = sock.recv_into(view[received:], n - received, _MSG_DONTWAIT)
+            except BlockingIOError:
+                misses += 1
+                if misses >= _BUSY_POLL_SPINS:
+                    if not select.select([sock], [], [], self.timeout)[0]:
+                        raise socket.timeout("timed out")
+                    misses = 0
+                continue
+
+            if not count:  # Connection closed
                 raise ConnectionError("Connection closed by server")
-            data += chunk
-            remaining -= len(chunk)
-
-        return data
+            received += count
+            misses = 0
 
     def recv_packet(self):
         """
         Receive a framed packet.
 
         Returns:
-            tuple[int, bytes, int] | None: ``(size, data_bytes, trailer_int)`` or ``None`` on error.
+            tuple[int, memoryview, int] | None: ``(size, data, trailer_int)`` or ``None`` on error.
+            ``data`` is a view over the receive buffer and is only valid until the next receive.
         """
         try:
             length_bytes = self._recv_exactly(self.header_bytes)
-            size = int.from_bytes(length_bytes)
+            size, = self._hdr.unpack_from(length_bytes)
             full_packet = self._recv_exactly(size)
             data, tail = self._unbuild_packet(full_packet, size)
             # print(f"size: {size}, tail {tail}")
@@ -440,6 +878,36 @@ class Client:
             self.logger.error(f"Error receiving packet: {e}")
             return None
 
+    def recv_packets(self, max_n: int = 8):
+        """
+        Receive one framed packet, then drain any further packets already waiting.
+
+        After the first (blocking) packet, the socket is polled with a zero timeout and
+        reading continues while data is ready, up to ``max_n`` packets, so back-to-back
+        responses are consumed in one call.
+
+        Args:
+            max_n (int): Maximum number of packets to return.
+
+        Returns:
+            list[tuple[int, bytes, int]]: ``(size, data_bytes, trailer_int)`` per packet; empty on error.
+            Payloads are copied out of the receive buffer so they stay valid together.
+        """
+        packets = []
+
+        while len(packets) < max_n:
+            packet = self.recv_packet()
+            if packet is None:
+                break
+
+            size, data, tail = packet
+            packets.append((size, bytes(data), tail))
+
+            if not select.select([self.client], [], [], 0)[0]:
+                break
+
+        return packets
+
     def send_packet(self, packet):
         """
         Send a raw packet.
@@ -456,6 +924,47 @@ class Client:
             return True
         except Exception as e:
             self.logger.error(f"Error sending packet: {e}")
+            self._lost_on(e)
+            return False
+
+    def _sendmsg_all(self, parts) -> None:
+        """
+        Send several buffers with one ``sendmsg`` call, completing any short send.
+
+        Args:
+            parts (tuple[bytes, ...]): Buffers to send in order.
+        """
+        sent = self.client.sendmsg(parts)
+
+        # sendmsg may return short under pressure; finish with the remaining bytes
+        if sent < sum(map(len, parts)):
+            self.client.sendall(b''.join(parts)[sent:])
+
+    def send_framed(self, payload: bytes, tail: int = 0) -> bool:
+        """
+        Send a payload framed with header and trailer without building the packet.
+
+        Uses ``sendmsg`` scatter-gather where available, so the three parts go out in a
+        single syscall without copying the payload; otherwise falls back to
+        ``_build_packet`` and ``sendall``.
+
+        Args:
+            payload (bytes): Packet payload.
+            tail (int): Trailer integer.
+
+        Returns:
+            bool: True if sent successfully.
+        """
+        try:
+            if not _HAS_SENDMSG:
+                self.client.sendall(self._build_packet(payload, tail))
+                return True
+
+            self._sendmsg_all((self._hdr.pack(len(payload) + self.trailer_bytes), payload, self._trl.pack(tail)))
+            return True
+        except Exception as e:
+            self.logger.error(f"Error sending packet: {e}")
+            self._lost_on(e)
             return False
 
     def send_and_receive(self,
@@ -473,8 +982,9 @@ class Client:
         Returns:
             dict: Parsed JSON response.
         """
-        self.send_message(message, retry_on_error)
-        return self.receive_message(timeout)
+        with self._io_lock:
+            self.send_message(message, retry_on_error)
+            return self.receive_message(timeout)
 
     # Wrappers
     def rpc(self, method, params, response=True):
@@ -487,24 +997,58 @@ class Client:
             response (bool): Whether to wait for and return a response.
 
         Returns:
-            tuple[int, str, int] | None: ``(size, json_str, tail)`` if ``response=True``, else ``None``.
+            tuple[int, dict, int] | None: ``(size, response_dict, tail)`` if ``response=True``, else ``None``.
         """
-        proxy = Proxy()
         request = self.handler.create_request(method, params)
-        request, hdr_tree = proxy.to_act(request)
-        packet = self._build_packet(request)
-
-        if response:
-            self.send_packet(packet)
-            size, data, tail = self.recv_packet()
-            data = proxy.from_act(data, hdr_tree)
-            tail = tail
-            data = json.dumps(data, cls=NpEncoder)
-            return size, data, tail
-        else:
-            self.send_packet(packet)
+        request, hdr_tree = self._proxy.to_act(request)
+        return self._exchange(request, hdr_tree, response)
+
+    def _exchange(self, request: bytes, hdr_tree: dict, response: bool = True):
+        """
+        Send a flattened Actor request and optionally decode the reply.
+
+        Args:
+            request (bytes): Flattened Actor cluster.
+            hdr_tree (dict): Metadata tree returned with ``request``.
+            response (bool): Whether to wait for and return a response.
+
+        Returns:
+            tuple[int, dict, int] | None: ``(size, response_dict, tail)`` if ``response=True``, else ``None``.
+
+        Raises:
+            ConnectionError: If the request cannot be sent or no response is received.
+        """
+        with self._io_lock:
+            if not self.send_framed(request):
+                raise ConnectionError("Failed to send request")
+            if not response:
+                return None
+
+            packet = self.recv_packet()
+            if packet is None:
+                raise ConnectionError("No response received")
+            size, data, tail = packet
+            return size, self._proxy.from_act(data, hdr_tree), tail
+
+    def rpc_json(self, method, params, response=True):
+        """
+        Perform an RPC call and return the response as JSON text.
+
+        Args:
+            method (str): RPC method name.
+            params (dict): Parameters.
+            response (bool): Whether to wait for and return a response.
+
+        Returns:
+            tuple[int, str, int] | None: ``(size, json_str, tail)`` if ``response=True``, else ``None``.
+        """
+        result = self.rpc(method, params, response)
+        if result is None:
             return None
 
+        size, data, tail = result
+        return size, _dumps(data).decode('utf-8'), tail
+
     def echo(self, message='test'):
         """
         Send an ``echo`` request and track its execution time.
@@ -513,8 +1057,7 @@ class Client:
             message (str): String to send.
         """
         if isinstance(message, str):
-            size, data, tail = self.rpc("echo", {'Message': message})
-            data = json.loads(data)
+            size, data, tail = self._exchange(*self._echo_request(message))
             exec_time = tail
 
             self.handler.process_message(data)
@@ -522,44 +1065,260 @@ class Client:
         else:
             self.logger.error("echo message must be a string")
 
-    def echo_benchmark(self):
+    def _echo_request(self, message: str):
+        """
+        Create and flatten an ``echo`` request.
+
+        Args:
+            message (str): String to send.
+
+        Returns:
+            tuple[bytes, dict]: (flat buffer, metadata tree), as returned by ``Proxy.to_act``.
+        """
+        return self._proxy.to_act(self.handler.create_request("echo", {'Message': message}))
+
+    def raw_echo(self, payload: bytes):
+        """
+        Send ``payload`` as a bare framed packet and return the echoed packet.
+
+        Skips request creation, Proxy flattening and response parsing, so only the
+        transport is exercised. The server must echo packets verbatim.
+
+        Args:
+            payload (bytes): Packet payload.
+
+        Returns:
+            tuple[bytes, int] | None: ``(payload_bytes, tail)`` or ``None`` on error.
+        """
+        with self._io_lock:
+            if not self.send_packet(self._build_packet(payload)):
+                return None
+            packet = self.recv_packet()
+            if packet is None:
+                return None
+
+            size, data, tail = packet
+            return bytes(data), tail
+
+    def echo_benchmark(self, raw: bool = False):
         """
         Run a benchmark using echo requests with increasing payload sizes.
 
         Iterates over multiple message sizes, repeating each size multiple times,
         and records metrics through the Benchmark tracker.
+
+        Args:
+            raw (bool): If True, measure transport only with ``raw_echo`` instead of
+                ``echo``. Round trips are timed here since there are no RPC messages
+                for the tracker to record.
+
+        Returns:
+            dict[int, list[float]] | None: Round-trip times in ms per payload size when
+            ``raw=True``, otherwise ``None``.
         """
-        import numpy
-        sizes = numpy.linspace(0, 9600, 21, dtype=int)
+        sizes = ECHO_SIZES
         iter = 10
+        runs = 3
 
-        self.handler.tracker.start_benchmark()
-        for i, size in enumerate(sizes):
-            size_progress = (i / len(sizes)) * 100
-            # self.logger.info(f"Testing payload size {size} bytes - {size_progress:.1f}% complete")
+        if raw:
+            return self._raw_echo_benchmark(sizes, iter, runs)
 
-            for j in range(iter):
-                payload = "X" * size
-                self.echo(payload)
-        self.handler.tracker.stop_benchmark()
+        # Build every payload once, up front, and reuse it across iterations and runs
+        payloads = ["X" * size for size in sizes]
 
-        self.handler.tracker.start_benchmark()
-        for i, size in enumerate(sizes):
+        for run in range(runs):
+            self.handler.tracker.start_benchmark()
+            for i, payload in enumerate(payloads):
+                size_progress = (i / len(sizes)) * 100
+                # self.logger.info(f"Testing payload size {sizes[i]} bytes - {size_progress:.1f}% complete")
 
-            for j in range(iter):
-                payload = "X" * size
-                self.echo(payload)
-        self.handler.tracker.stop_benchmark()
-
-        self.handler.tracker.start_benchmark()
-        for i, size in enumerate(sizes):
-            for j in range(iter):
-                payload = "X" * size
-                self.echo(payload)
-        self.handler.tracker.stop_benchmark()
+                for j in range(iter):
+                    self.echo(payload)
+            self.handler.tracker.stop_benchmark()
 
         #self.handler.tracker.export(format='json', filename='actor_benchmark_optimized')
 
+    def _raw_echo_benchmark(self, sizes, iter, runs):
+        """
+        Time ``raw_echo`` round trips for each payload size.
+
+        Args:
+            sizes (tuple[int, ...]): Payload sizes in bytes.
+            iter (int): Repetitions per size and run.
+            runs (int): Number of passes over ``sizes``.
+
+        Returns:
+            dict[int, list[float]]: Round-trip times in ms per payload size.
+        """
+        payloads = [b"X" * size for size in sizes]
+        latencies = {size: [] for size in sizes}
+        clock = time.perf_counter_ns
+
+        for run in range(runs):
+            for size, payload in zip(sizes, payloads):
+                samples = latencies[size]
+                for j in range(iter):
+                    start = clock()
+                    self.raw_echo(payload)
+                    samples.append((clock() - start) / 1e6)
+
+        return latencies
+
+class ClientPool:
+    """
+    Pool of connected ``Client`` instances to one server.
+
+    Clients are created lazily up to ``size`` and leased one per call, so concurrent
+    threads issue RPCs over separate connections instead of queueing behind a single
+    socket round trip.
+    """
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 6363,
+                 size: int = 8,
+                 max_rpcs_per_conn: Optional[int] = None,
+                 **kwargs):
+        """
+        Initialize an empty pool.
+
+        Args:
+            host (str): Target hostname or IP address.
+            port (int): TCP port of the server.
+            size (int): Maximum number of open connections.
+            max_rpcs_per_conn (int | None): If set, a connection is closed and replaced after
+                this many leases.
+            **kwargs: Extra ``Client`` constructor arguments.
+        """
+        self.host = host
+        self.port = port
+        self.size = size
+        self.max_rpcs_per_conn = max_rpcs_per_conn
+        self.client_kwargs = kwargs
+
+        self.logger = Logger.get_logger(type(self).__name__)
+
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._created = 0
+        self._closed = False
+        self._lock = threading.Lock()  # Guards _uses, _created and _closed
+
+    def get(self, timeout: Optional[float] = None) -> Client:
+        """
+        Take a connected client from the pool, opening a new connection if allowed.
+
+        Args:
+            timeout (float | None): Maximum time to wait when every connection is leased.
+
+        Returns:
+            Client: Connected client; give it back with ``put()``.
+
+        Raises:
+            ConnectionError: If a new connection cannot be established.
+            TimeoutError: If no client becomes available within ``timeout``.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            grow = self._created < self.size
+            if grow:
+                self._created += 1
+
+        if grow:
+            client = Client(host=self.host, port=self.port, **self.client_kwargs)
+            try:
+                client.connect()
+            except ConnectionError:
+                with self._lock:
+                    self._created -= 1
+                raise
+            with self._lock:
+                self._uses[client] = 0
+            return client
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No pooled connection available within {timeout}s")
+
+    def put(self, client: Client) -> None:
+        """
+        Return a leased client to the pool.
+
+        Disconnected clients, and clients that reached ``max_rpcs_per_conn``, are closed
+        and dropped so the next ``get()`` opens a fresh connection.
+
+        Args:
+            client (Client): Client obtained from ``get()``.
+        """
+        with self._lock:
+            uses = self._uses.get(client, 0) + 1
+            keep = (not self._closed and client.connected
+                    and (self.max_rpcs_per_conn is None or uses < self.max_rpcs_per_conn))
+            if keep:
+                self._uses[client] = uses
+                self._idle.put(client)  # Under the lock, so close() cannot miss it
+                return
+            self._uses.pop(client, None)
+            self._created -= 1
+
+        client.disconnect()
+
+    @contextlib.contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """
+        Context manager that leases a client and returns it to the pool afterwards.
+
+        Args:
+            timeout (float | None): Maximum time to wait for a free client.
+
+        Yields:
+            Client: Connected client.
+        """
+        client = self.get(timeout)
+        try:
+            yield client
+        finally:
+            self.put(client)
+
+    def rpc(self, method, params, response=True):
+        """
+        Perform an RPC call on a leased client. See ``Client.rpc``.
+        """
+        with self.lease() as client:
+            return client.rpc(method, params, response)
+
+    def send_and_receive(self,
+                         message: Dict[str, Any],
+                         timeout: Optional[float] = None,
+                         retry_on_error: bool = True) -> Any:
+        """
+        Send a message and receive the reply on a leased client. See ``Client.send_and_receive``.
+        """
+        with self.lease() as client:
+            return client.send_and_receive(message, timeout, retry_on_error)
+
+    def close(self) -> None:
+        """
+        Disconnect every idle client. Leased clients are closed when returned.
+        """
+        with self._lock:
+            self._closed = True  # Anything returned from now on is closed
+
+        while True:
+            try:
+                client = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            client.disconnect()
+            with self._lock:
+                self._uses.pop(client, None)
+                self._created -= 1
+
+
 if __name__ == "__main__":
     local = True
 
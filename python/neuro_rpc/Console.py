@@ -9,11 +9,9 @@ Notes:
     - Available commands and modules are preloaded in the interactive namespace.
 """
 
-import code
-import os
-import platform
+import sys
 
-from python.neuro_rpc.Logger import Logger, LoggerConfig
+from python.neuro_rpc.Logger import Logger, LoggerConfig, prepare_console
 from python.neuro_rpc.Client import Client
 
 
@@ -25,6 +23,37 @@ class Console:
     convenience commands in an interactive REPL environment. Provides status checks
     and log outputs for debugging.
     """
+    # Welcome message shown when the REPL starts
+    _BANNER = """
+=================================================================
+Message Client Interactive Console
+=================================================================
+
+The client is not thread_running yet. To start it, use:
+    start()
+
+Client object is available as 'client' variable.
+Once started, use client().method() to interact with the client.
+
+Available commands:
+    start() - Start the client in background
+    stop()  - Stop the thread_running client
+    status() - Get the status of the client
+    cls() - Clear the console screen
+
+Available modules:
+    logger - NeuroRPC logger
+    config_logger - NeuroRPC logger configuration
+
+Press Ctrl+D (or Ctrl+Z on Windows) to exit the console.
+=================================================================
+"""
+
+    # Namespace entries shared by every console
+    _NAMESPACE = {
+        'logger': Logger,
+        'config_logger': LoggerConfig,
+    }
 
     def __init__(self, client_config=None):
         """
@@ -38,6 +67,8 @@ class Console:
         self.client_config = client_config or {}
         self.client = None
         self.running = False
+        self._request_methods = None   # Handler method tables, looked up once per client
+        self._response_methods = None
         self.logger = Logger.get_logger(self.__class__.__name__)
 
     def start_client(self):
@@ -50,6 +81,9 @@ class Console:
         # Use existing client instance or create a new one if needed
         if self.client is None:
             self.client = self.client_class(**self.client_config)
+            handler = getattr(self.client, 'handler', None)
+            self._request_methods = getattr(handler, 'request_methods', None)
+            self._response_methods = getattr(handler, 'response_methods', None)
 
         self.client.start()
 
@@ -93,12 +127,10 @@ class Console:
             status.append("Client not thread_running in background")
 
         # Show handler info if available
-        if hasattr(self.client, 'handler'):
-            handler = self.client.handler
-            if hasattr(handler, 'request_methods'):
-                status.append(f"Request methods: {list(handler.request_methods.keys())}")
-            if hasattr(handler, 'response_methods'):
-                status.append(f"Response methods: {list(handler.response_methods.keys())}")
+        if self._request_methods is not None:
+            status.append(f"Request methods: {list(self._request_methods.keys())}")
+        if self._response_methods is not None:
+            status.append(f"Response methods: {list(self._response_methods.keys())}")
 
         self.logger.info("\n".join(status))
 
@@ -107,14 +139,12 @@ class Console:
         Clear the console screen.
 
         Notes:
-            Uses OS-specific commands: ``cls`` on Windows, ``clear`` on Unix-like systems.
+            Writes the ANSI clear-screen and cursor-home sequences instead of spawning
+            ``cls``/``clear``; ``prepare_console`` enables them on Windows consoles.
         """
-        system = platform.system().lower()
-
-        if system == 'windows':
-            os.system('cls')
-        else:  # For Linux, macOS, etc.
-            os.system('clear')
+        prepare_console()
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
 
     def run(self):
         """
@@ -142,46 +172,30 @@ class Console:
         Provides start/stop/status/cls commands and access to Logger and LoggerConfig.
         A banner with usage instructions is displayed at startup.
         """
-        # Prepare the welcome message
-        banner = """
-=================================================================
-Message Client Interactive Console
-=================================================================
-
-The client is not thread_running yet. To start it, use:
-    start()
-
-Client object is available as 'client' variable.
-Once started, use client().method() to interact with the client.
-
-Available commands:
-    start() - Start the client in background
-    stop()  - Stop the thread_running client
-    status() - Get the status of the client
-    cls() - Clear the console screen
-
-Available modules:
-    logger - NeuroRPC logger
-    config_logger - NeuroRPC logger configuration
-
-Press Ctrl+D (or Ctrl+Z on Windows) to exit the console.
-=================================================================
-"""
-
-        # Prepare the namespace for the console
-        namespace = {
-            'client': lambda: self.client,
-            'start': self.start_client,
-            'stop': self.stop_client,
-            'status': self.client_status,
-            'cls': self.clear_screen,
-            'logger': Logger,
-            'config_logger': LoggerConfig,
-        }
+        # Prepare the namespace for the console: shared modules plus this console's commands
+        namespace = dict(self._NAMESPACE,
+                         client=lambda: self.client,
+                         start=self.start_client,
+                         stop=self.stop_client,
+                         status=self.client_status,
+                         cls=self.clear_screen)
+
+        # Line editing, history and tab completion over the namespace (readline is not
+        # available on every platform, e.g. stock Windows)
+        try:
+            import readline
+            import rlcompleter
+        except ImportError:
+            pass
+        else:
+            readline.set_completer(rlcompleter.Completer(namespace).complete)
+            readline.parse_and_bind("tab: complete")
+            readline.set_history_length(1000)
 
         # Create and start the console
+        import code
         console = code.InteractiveConsole(locals=namespace)
-        console.interact(banner=banner)
+        console.interact(banner=self._BANNER)
 
         # When console exits, make sure to clean up
         self.logger.info("Exiting interactive console...")
@@ -6,16 +6,55 @@ All modules (Client, Benchmark, RPC stack, Console) use this centralized logging
 infrastructure to ensure consistent formatting and runtime readability.
 
 Notes:
-    - Uses colorama for cross-platform color handling.
+    - Colors are plain ANSI codes; on Windows colorama enables them for the console,
+      imported only once the first colored record is written.
     - Verbosity can be adjusted dynamically.
+    - Logging calls only enqueue the record; formatting and output happen on a single
+      background listener thread.
+    - Output is block-buffered: records below WARNING are flushed at least once per
+      ``FLUSH_INTERVAL`` seconds, WARNING and above immediately.
 """
 
+import atexit
+import io
 import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+import weakref
 
-from colorama import Fore, Back, Style, init
 
-# Initialize colorama for cross-platform compatibility
-init(autoreset=True)
+def _stdout_is_tty() -> bool:
+    """
+    Check once whether stdout is an interactive terminal.
+
+    Returns:
+        bool: True if stdout is a TTY.
+    """
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+# Colorize only when writing to a terminal; redirected logs stay plain text
+_USE_COLOR = _stdout_is_tty()
+_console_ready = False
+
+
+def prepare_console() -> None:
+    """
+    Make the console render ANSI codes; called before the first colored record.
+
+    Only Windows consoles need this; colorama is imported there and nowhere else.
+    """
+    global _console_ready
+    _console_ready = True
+    if sys.platform == "win32":
+        import colorama
+        colorama.just_fix_windows_console()
 
 
 class ColoredFormatter(logging.Formatter):
@@ -24,15 +63,40 @@ class ColoredFormatter(logging.Formatter):
 
     Extends ``logging.Formatter`` to prepend log messages with ANSI color codes
     depending on the log level. Colors are reset automatically after each message.
+    The color codes are baked into one format template per level, so each record is
+    rendered in a single pass. When stdout is not a TTY no color codes are added.
     """
     COLORS = {
-        logging.DEBUG: Fore.BLUE,
-        logging.INFO: Fore.GREEN,
-        logging.WARNING: Fore.YELLOW,
-        logging.ERROR: Fore.RED,
-        logging.CRITICAL: Back.RED + Fore.WHITE,
+        logging.DEBUG: "\x1b[34m",              # Blue
+        logging.INFO: "\x1b[32m",               # Green
+        logging.WARNING: "\x1b[33m",            # Yellow
+        logging.ERROR: "\x1b[31m",              # Red
+        logging.CRITICAL: "\x1b[41m\x1b[37m",   # White on red
     }
-    RESET = Style.RESET_ALL
+    RESET = "\x1b[0m"
+
+    def __init__(self, fmt=None, datefmt=None):
+        """
+        Initialize the formatter and precompute the per-level colored templates.
+
+        Args:
+            fmt (str): ``%``-style format string.
+            datefmt (str): Optional date format string.
+        """
+        super().__init__(fmt, datefmt)
+        fmt = self._style._fmt
+        self._colored = _USE_COLOR
+        if not _USE_COLOR:
+            self._default = logging.Formatter(fmt, datefmt)
+            self._formatters = (self._default,) * (max(self.COLORS) + 1)
+            return
+
+        self._default = logging.Formatter(self.RESET + fmt + self.RESET, datefmt)
+        # Indexed directly by levelno; levels without a color use the default
+        table = [self._default] * (max(self.COLORS) + 1)
+        for level, color in self.COLORS.items():
+            table[level] = logging.Formatter(color + fmt + self.RESET, datefmt)
+        self._formatters = tuple(table)
 
     def format(self, record):
         """
@@ -44,9 +108,321 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             str: Formatted string with ANSI colors.
         """
-        msg = super().format(record)
-        color = self.COLORS.get(record.levelno, self.RESET)
-        return f"{color}{msg}{self.RESET}"
+        if self._colored and not _console_ready:
+            prepare_console()
+        try:
+            return self._formatters[record.levelno].format(record)
+        except IndexError:  # Custom level above CRITICAL
+            return self._default.format(record)
+
+
+FLUSH_INTERVAL = 1.0
+BUFFER_SIZE = 8192
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that leaves flushing to a background timer.
+
+    ``logging.StreamHandler`` flushes after every record, i.e. one ``write`` syscall per
+    log line. This handler writes into a buffered stream and only flushes for records
+    at ``flush_level`` or above; everything else is flushed by a shared background
+    thread every ``FLUSH_INTERVAL`` seconds and at interpreter exit.
+    """
+    flush_level = logging.WARNING
+
+    _handlers = weakref.WeakSet()
+    _flusher = None
+
+    def __init__(self, stream=None):
+        """
+        Initialize the handler and make sure the background flusher is running.
+
+        Args:
+            stream: Stream to write to (defaults to ``sys.stderr`` as in ``StreamHandler``).
+        """
+        super().__init__(stream)
+        BufferedStreamHandler._handlers.add(self)
+        BufferedStreamHandler._start_flusher()
+
+    def emit(self, record):
+        """
+        Write a formatted record, flushing only for important records.
+
+        Args:
+            record (logging.LogRecord): Log record to emit.
+        """
+        self.emit_formatted(record, self)
+
+    def emit_formatted(self, record, formatter):
+        """
+        Write a record rendered by ``formatter``, flushing only for important records.
+
+        Args:
+            record (logging.LogRecord): Log record to emit.
+            formatter: Object whose ``format(record)`` renders the line (a Formatter or Handler).
+        """
+        try:
+            self.stream.write(formatter.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    @staticmethod
+    def flush_all() -> None:
+        """
+        Flush every live buffered handler and the shared log stream.
+
+        The shared stream is flushed directly too, since output written by a handler
+        that has since been released stays in its buffer.
+        """
+        flushes = [handler.flush for handler in list(BufferedStreamHandler._handlers)]
+        if _log_stream is not None:
+            flushes.append(_log_stream.flush)
+        for flush in flushes:
+            try:
+                flush()
+            except (OSError, ValueError):  # Stream already closed (e.g. a replaced sys.stdout)
+                pass
+
+    @staticmethod
+    def _start_flusher() -> None:
+        """
+        Start the daemon thread that periodically flushes all buffered handlers.
+        """
+        if BufferedStreamHandler._flusher is not None:
+            return
+
+        def flush_loop():
+            while not stop.wait(FLUSH_INTERVAL):
+                BufferedStreamHandler.flush_all()
+
+        stop = threading.Event()
+        BufferedStreamHandler._flusher = threading.Thread(target=flush_loop, name="LogFlusher", daemon=True)
+        BufferedStreamHandler._flusher.start()
+        atexit.register(BufferedStreamHandler.flush_all)
+
+
+_log_stream = None
+
+
+def _real_stdout():
+    """
+    Return the interpreter's original stdout when ``sys.stdout`` still writes to it.
+
+    ``sys.stdout`` may be a wrapper around the same file descriptor (e.g. colorama's
+    ``StreamWrapper``); in that case the unwrapped ``sys.__stdout__`` is returned.
+
+    Returns:
+        io.TextIOWrapper | None: Original stdout, or None if output is redirected
+        elsewhere (a notebook, pytest's capture) or stdout has no file descriptor.
+    """
+    real = sys.__stdout__
+    if not isinstance(real, io.TextIOWrapper):
+        return None
+    try:
+        if sys.stdout is real or sys.stdout.fileno() == real.fileno():
+            return real
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+
+def get_log_stream():
+    """
+    Return the shared block-buffered stdout stream used by all loggers.
+
+    Writes go to stdout's file descriptor through an ``BUFFER_SIZE`` buffer, whether
+    or not ``sys.stdout`` has been wrapped (e.g. by colorama). When ``sys.stdout`` is
+    not backed by that descriptor (a notebook, a captured stream), ``sys.stdout``
+    itself is returned.
+
+    Returns:
+        io.TextIOBase: Stream for log output.
+
+    Notes:
+        Colors come from ``ColoredFormatter``; the stream itself is never wrapped.
+    """
+    global _log_stream
+    if _log_stream is None:
+        stdout = _real_stdout()
+        if stdout is None:
+            _log_stream = sys.stdout
+        else:
+            _log_stream = open(stdout.fileno(), 'w', buffering=BUFFER_SIZE,
+                               encoding=stdout.encoding, errors=stdout.errors, closefd=False)
+
+    return _log_stream
+
+
+class LoggerQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that forwards records together with their output handler.
+
+    The target handler and its current formatter are enqueued alongside the record, so
+    the listener renders each record with the settings in effect when it was logged.
+    Records are not formatted on the calling thread.
+    """
+    # Arguments that cannot change before the listener renders the message
+    _IMMUTABLE_ARGS = (str, int, float, bool, bytes, type(None))
+
+    def __init__(self, queue_, target):
+        """
+        Initialize the handler.
+
+        Args:
+            queue_ (queue.SimpleQueue): Queue drained by the ``LogListener``.
+            target (BufferedStreamHandler): Handler that writes the record out.
+        """
+        super().__init__(queue_)
+        self.target = target
+
+    def prepare(self, record):
+        """
+        Prepare a record for the queue without formatting it.
+
+        ``QueueHandler.prepare`` formats the record on the calling thread; here that is
+        left to the listener. Only when an argument is mutable (and could change before
+        the listener runs) is the message merged with its arguments up front.
+        ``exc_info`` is kept and rendered by the listener.
+
+        Args:
+            record (logging.LogRecord): Record to enqueue.
+
+        Returns:
+            logging.LogRecord: The same record.
+        """
+        args = record.args
+        if args:
+            values = args.values() if isinstance(args, dict) else args
+            if not all(isinstance(v, self._IMMUTABLE_ARGS) for v in values):
+                record.msg = record.getMessage()
+                record.args = None
+        return record
+
+    def enqueue(self, record):
+        """
+        Enqueue ``(target, formatter, record)`` for the listener.
+
+        Args:
+            record (logging.LogRecord): Record returned by ``prepare``.
+        """
+        self.queue.put_nowait((self.target, self.target.formatter, record))
+
+
+class LogListener(logging.handlers.QueueListener):
+    """
+    QueueListener that writes each record through the handler it was enqueued with.
+    """
+
+    def __init__(self, queue_, respect_handler_level=True):
+        """
+        Initialize the listener.
+
+        Args:
+            queue_ (queue.SimpleQueue): Queue fed by the loggers' ``LoggerQueueHandler``.
+            respect_handler_level (bool): Drop records below the target handler's level.
+        """
+        super().__init__(queue_, respect_handler_level=respect_handler_level)
+
+    def handle(self, item):
+        """
+        Emit a dequeued record.
+
+        Args:
+            item (tuple): ``(handler, formatter, record)`` from ``LoggerQueueHandler``.
+        """
+        handler, formatter, record = item
+        if self.respect_handler_level and record.levelno < handler.level:
+            return
+        handler.acquire()
+        try:
+            handler.emit_formatted(record, formatter or handler)
+        finally:
+            handler.release()
+
+
+_listener = None
+
+
+def get_log_listener():
+    """
+    Return the process-wide log listener, starting it on first use.
+
+    Returns:
+        LogListener: Running listener draining the shared log queue.
+    """
+    global _listener
+    if _listener is None:
+        _listener = LogListener(queue.SimpleQueue())
+        _listener.start()
+        atexit.register(_listener.stop)  # Runs before the final flush (atexit is LIFO)
+    return _listener
+
+
+class RateFilter(logging.Filter):
+    """
+    Filter that caps how often a single log call site may emit per second.
+
+    Records at or below ``level`` coming from the same source line are counted in
+    one-second windows; once ``max_per_sec`` is reached the rest of that window is
+    dropped. Higher-level records always pass.
+    """
+
+    def __init__(self, max_per_sec: int = 1000, level=logging.DEBUG):
+        """
+        Initialize the filter.
+
+        Args:
+            max_per_sec (int): Records allowed per call site per second.
+            level (int): Highest level subject to rate limiting (default ``DEBUG``).
+        """
+        super().__init__()
+        self.max_per_sec = max_per_sec
+        self.level = level
+        self._windows = {}  # (pathname, lineno) -> (window_start, count)
+
+    def filter(self, record):
+        """
+        Decide whether a record is emitted.
+
+        Args:
+            record (logging.LogRecord): Record to check.
+
+        Returns:
+            bool: False if the record's call site is over its rate limit.
+        """
+        if record.levelno > self.level:
+            return True
+
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        start, count = self._windows.get(key, (now, 0))
+        if now - start >= 1.0:
+            start, count = now, 0
+        count += 1
+        self._windows[key] = (start, count)
+        return count <= self.max_per_sec
+
+
+def set_context_capture(enabled: bool) -> None:
+    """
+    Toggle collection of process/thread context on every ``LogRecord``.
+
+    ``LogRecord`` looks up the pid, process name, thread name and asyncio task for
+    each record unless the corresponding ``logging`` module flags are off. Only the
+    verbose format prints them, so compact output can skip that work.
+
+    Args:
+        enabled (bool): True to collect context (stdlib default), False to skip it.
+    """
+    logging.logThreads = enabled
+    logging.logProcesses = enabled
+    logging.logMultiprocessing = enabled
+    logging.logAsyncioTasks = enabled
 
 
 class Logger(logging.Logger):
@@ -62,9 +438,17 @@ class Logger(logging.Logger):
     ERROR = logging.ERROR
     CRITICAL = logging.CRITICAL
 
-    # Dictionary to store loggers by name
+    # Loggers by name; kept until ``release`` so settings survive between lookups
     _instances = {}
 
+    # Filters installed by the active ``LoggerConfig`` preset, also added to loggers created later
+    _preset_filters = []
+
+    # Formatters shared by all loggers (compact and verbose)
+    _FMT_COMPACT = ColoredFormatter('[%(levelname)s] [%(name)s] [%(module)s:%(lineno)d] - %(message)s')
+    _FMT_VERBOSE = ColoredFormatter('[%(levelname)s] [%(name)s] [%(processName)s:%(process)d] '
+                                    '[%(threadName)s] [%(module)s:%(lineno)d] - %(message)s')
+
     @staticmethod
     def print_loggers():
         """
@@ -72,8 +456,9 @@ class Logger(logging.Logger):
 
         Useful for debugging which loggers are active and their configuration.
         """
-        for name, logger in Logger._instances.items():
-            print(f"{name}: {logger} {logger.handlers} {logger.level}")
+        lines = [f"{name}: {logger} {logger.handlers} {logger.level}\n"
+                 for name, logger in list(Logger._instances.items())]
+        sys.stdout.write("".join(lines))
 
     @staticmethod
     def get_logger(name="__neuro__", level=logging.DEBUG, verbose=True):
@@ -89,11 +474,41 @@ class Logger(logging.Logger):
             Logger: Configured logger instance.
 
         Notes:
-            Attaches a StreamHandler on first creation.
+            Attaches a ``LoggerQueueHandler`` feeding the shared ``LogListener`` on first
+            creation only; later calls return the same logger with its current settings.
+        """
+        logger = Logger._instances.get(name)
+        if logger is None:
+            logger = Logger._instances.setdefault(name, Logger(name, level, verbose))
+        return logger
+
+    @staticmethod
+    def release(name) -> bool:
+        """
+        Drop a logger so it can be garbage collected.
+
+        Meant for dynamically named loggers (e.g. one per connection) in long-running
+        processes. Pending output is flushed and the logger's handlers are detached; a
+        later ``get_logger(name)`` creates a fresh logger.
+
+        Args:
+            name (str): Logger identifier.
+
+        Returns:
+            bool: True if a logger with that name was registered.
         """
-        if name not in Logger._instances:
-            Logger._instances[name] = Logger(name, level, verbose)
-        return Logger._instances[name]
+        logger = Logger._instances.pop(name, None)
+        if logger is None:
+            return False
+
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.stream_handler.flush()
+
+        logger_dict = logging.Logger.manager.loggerDict
+        if logger_dict.get(name) is logger:
+            del logger_dict[name]
+        return True
 
     def __init__(self, name: str, level=logging.DEBUG, verbose: bool = True):
         """
@@ -106,13 +521,14 @@ class Logger(logging.Logger):
         """
         super().__init__(name, level)
 
-        # Set up attributes
+        # Set up attributes (context capture is global and left to set_context_capture and the presets)
         self.verbose = verbose
 
-        # Add a StreamHandler
-        import sys
-        self.stream_handler = logging.StreamHandler(sys.stdout)
-        self.addHandler(self.stream_handler)
+        # Format and write on the listener thread; callers only enqueue the record
+        self.stream_handler = BufferedStreamHandler(get_log_stream())
+        self.addHandler(LoggerQueueHandler(get_log_listener().queue, self.stream_handler))
+        for preset_filter in Logger._preset_filters:
+            self.addFilter(preset_filter)
 
         # Set initial levels and formatter
         self.setLevel(level)
@@ -122,13 +538,9 @@ class Logger(logging.Logger):
         """
         Configure formatter for the stream handler.
 
-        Chooses between compact and verbose formats depending on verbosity flag.
+        Chooses between the shared compact and verbose formatters depending on verbosity flag.
         """
-        info = '[%(levelname)s] [%(name)s] [%(module)s:%(lineno)d] - %(message)s'
-        if self.verbose:
-            info = '[%(levelname)s] [%(name)s] [%(processName)s:%(process)d] [%(threadName)s] [%(module)s:%(lineno)d] - %(message)s'
-        formatter = ColoredFormatter(info)
-        self.stream_handler.setFormatter(formatter)
+        self.stream_handler.setFormatter(Logger._FMT_VERBOSE if self.verbose else Logger._FMT_COMPACT)
 
     def setLevel(self, level) -> None:
         """
@@ -138,6 +550,7 @@ class Logger(logging.Logger):
             level (int): New log level.
         """
         super().setLevel(level)
+        self._cache.clear()  # Not registered with the logging manager, which only clears its own loggers
         self.stream_handler.setLevel(level)  # Ensure handler level matches logger level
 
     def setVerbose(self, verbose: bool) -> None:
@@ -148,6 +561,8 @@ class Logger(logging.Logger):
             verbose (bool): True for detailed context, False for compact output.
         """
         self.verbose = verbose
+        if verbose:
+            set_context_capture(True)  # The verbose format prints process/thread info
         self._set_formatter()
 
     def test(self) -> None:
@@ -169,28 +584,58 @@ class LoggerConfig:
 
     Provides presets for production, development, and per-component debugging.
     """
+    # Shared DEBUG rate limiter installed by the production preset
+    rate_filter = RateFilter()
 
     @staticmethod
     def configure_for_production():
         """
         Configure all loggers for production.
 
-        Sets ``INFO`` level and disables verbose formatting.
+        Sets ``INFO`` level, disables verbose formatting, stops collecting
+        process/thread context on log records and rate-limits DEBUG records
+        (see ``RateFilter``), including on loggers created afterwards.
         """
-        for name, logger_instance in Logger._instances.items():
-            logger_instance.setLevel(logging.INFO)
-            logger_instance.setVerbose(False)
+        LoggerConfig._apply_to_all(logging.INFO, False)
+        if LoggerConfig.rate_filter not in Logger._preset_filters:
+            Logger._preset_filters.append(LoggerConfig.rate_filter)
+        for logger_instance in list(Logger._instances.values()):
+            logger_instance.addFilter(LoggerConfig.rate_filter)
 
     @staticmethod
     def configure_for_development():
         """
         Configure all loggers for development.
 
-        Sets ``DEBUG`` level and enables verbose formatting.
+        Sets ``DEBUG`` level, enables verbose formatting, restores process/thread
+        context collection and removes the production rate limit.
+        """
+        LoggerConfig._apply_to_all(logging.DEBUG, True)
+        if LoggerConfig.rate_filter in Logger._preset_filters:
+            Logger._preset_filters.remove(LoggerConfig.rate_filter)
+        for logger_instance in list(Logger._instances.values()):
+            logger_instance.removeFilter(LoggerConfig.rate_filter)
+
+    @staticmethod
+    def _apply_to_all(level, verbose):
+        """
+        Apply a level and verbosity to every registered logger in one pass.
+
+        Writes the level and the shared formatter directly instead of going through
+        ``setLevel``/``setVerbose`` for each logger.
+
+        Args:
+            level (int): Log level.
+            verbose (bool): Verbosity flag.
         """
-        for name, logger_instance in Logger._instances.items():
-            logger_instance.setLevel(logging.DEBUG)
-            logger_instance.setVerbose(True)
+        formatter = Logger._FMT_VERBOSE if verbose else Logger._FMT_COMPACT
+        for logger_instance in list(Logger._instances.values()):
+            logger_instance.level = level
+            logger_instance._cache.clear()
+            logger_instance.verbose = verbose
+            logger_instance.stream_handler.level = level
+            logger_instance.stream_handler.formatter = formatter
+        set_context_capture(verbose)
 
     @staticmethod
     def configure_for_debugging(component_name, level=logging.DEBUG, verbose=True):
@@ -205,12 +650,13 @@ class LoggerConfig:
         Notes:
             Creates a new logger if not already registered.
         """
-        if component_name in Logger._instances:
-            Logger._instances[component_name].setLevel(level)
-            Logger._instances[component_name].setVerbose(verbose)
+        logger_instance = Logger._instances.get(component_name)
+        if logger_instance is not None:
+            logger_instance.setLevel(level)
+            logger_instance.setVerbose(verbose)
         else:
-            Logger.get_logger(component_name, level, verbose)
-            Logger._instances[component_name].warning(f"Logger '{component_name}' not found. Creating a new one.")
+            logger_instance = Logger.get_logger(component_name, level, verbose)
+            logger_instance.warning(f"Logger '{component_name}' not found. Creating a new one.")
 
 
 if __name__ == "__main__":
@@ -7,42 +7,135 @@ RPCRequest/RPCResponse to support actor-style communication with LabVIEW classes
 
 Notes:
     - Extends ClusterConverter from ``python.labview_data.type_converters``.
+    - Nested clusters travel as LabVIEW strings holding their flattened bytes; those
+      bytes are carried as ``bytes`` end to end, never decoded to ``str``.
 """
 
-from python.labview_data.types import Cluster
-from python.labview_data.utils import SerializationData, HeaderInfo, DeserializationData
-from python.labview_data.type_converters import ClusterConverter
+from python.labview_data.utils import (SerializationData, SerializationResult, HeaderInfo, DeserializationData,
+                                       LVDtypes, bytes2num, num2bytes)
+from python.labview_data.type_converters import ClusterConverter, StringConverter
 
 import numpy as np
-import json
+import functools
+import struct
+import types
+import uuid
+from typing import NamedTuple
 
 from python.neuro_rpc.RPCMessage import RPCRequest, RPCResponse
 
 
-class NpEncoder(json.JSONEncoder):
+def to_builtin(obj):
     """
-    JSON encoder for NumPy data types.
+    Recursively convert NumPy values inside dicts/lists into native Python types.
 
-    Converts ``numpy.integer``, ``numpy.floating``, and ``numpy.ndarray`` into standard
-    Python ``int``, ``float``, and ``list`` for JSON serialization compatibility.
+    Applies the same conversions as ``NpEncoder`` without a JSON round-trip, so the
+    result can be handed to ``json.dumps`` or ``RPCMessage.to_json`` directly.
+
+    Args:
+        obj (Any): Object to convert.
+
+    Returns:
+        Any: ``obj`` with NumPy scalars and arrays replaced by ``int``/``float``/``list``.
     """
-    def default(self, obj):
-        """
-        Override JSON encoding for NumPy objects.
+    if isinstance(obj, dict):
+        return {k: to_builtin(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_builtin(v) for v in obj]
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    return obj
 
-        Args:
-            obj (Any): Object to encode.
 
-        Returns:
-            Any: Encoded Python-native type.
-        """
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        return super().default(obj)
+_U32 = struct.Struct(">I")
+_I32 = struct.Struct(">i")
+
+ID_MODES = ("ascii", "bytes")
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_message(message: str) -> bytes:
+    """
+    Encode an Actor Message with the LabVIEW codepage, caching recent results.
+
+    Request ids are unique, but the same Message text is often sent repeatedly
+    (benchmarks, heartbeats, fixed replies).
+
+    Args:
+        message (str): Message text.
+
+    Returns:
+        bytes: Encoded message.
+    """
+    return message.encode(LVDtypes.codepage)
+
+def _uuid_bytes(request_id):
+    """
+    Return the 16 raw bytes of a canonical UUID string id.
+
+    Only ids that round-trip exactly (lowercase, hyphenated) qualify, so the id read
+    back from the raw bytes equals the one sent.
+
+    Args:
+        request_id (Any): Request id.
+
+    Returns:
+        bytes | None: Raw UUID bytes, or None if ``request_id`` is not a canonical UUID string.
+    """
+    if type(request_id) is not str or len(request_id) != 36:
+        return None
+    try:
+        value = uuid.UUID(request_id)
+    except ValueError:
+        return None
+    return value.bytes if str(value) == request_id else None
+
+# Shared default context. The converters only ever modify forks of it, never this object.
+_DEFAULT_SDATA = SerializationData(version=0)
+
+
+class ClusterTuple(tuple):
+    """
+    ``(values, keys)`` pair of a nested cluster.
+
+    Marks nested clusters produced by ``Proxy`` so ``tuple_to_dict`` can recognise them
+    with a single type check.
+    """
+    __slots__ = ()
+
+
+class TreeChild(NamedTuple):
+    """
+    Metadata tree entry for a nested cluster.
+
+    Attributes:
+        index (int): Position of the nested cluster in its parent.
+        keys (list): Keys of the nested cluster.
+        tree (dict): Metadata tree of the nested cluster.
+    """
+    index: int
+    keys: list
+    tree: dict
+
+
+class FlatBufferConverter(StringConverter):
+    """
+    Serialize ``bytes`` as a LabVIEW string without any text encoding.
+
+    Used for nested cluster buffers, which are already flattened and must be
+    written byte for byte.
+    """
+    supported_codes = ()
+    supported_types = (bytes, )
+
+    @classmethod
+    def _serialize(cls, value: bytes, info: SerializationData):
+        return SerializationResult(
+            code=0x30,
+            header=b"\xff\xff\xff\xff",
+            buffer=num2bytes(len(value), LVDtypes.u4) + value,
+            depth=info.depth
+        )
 
 
 class Proxy(ClusterConverter):
@@ -53,13 +146,59 @@ class Proxy(ClusterConverter):
     Cluster format, supporting serialization for sending RPC requests and
     deserialization of responses.
     """
-    Actor = {"Class name": "", "Priority": np.int32(2), "Data": {}}
+    @staticmethod
+    def dumps(obj) -> bytes:
+        """
+        Serialize ``obj`` to UTF-8 JSON bytes, encoding NumPy values natively.
+
+        Imports the JSON helpers on first use so that loading ``Proxy`` stays free of them.
+
+        Args:
+            obj (Any): Object to serialize.
+
+        Returns:
+            bytes: JSON document.
+        """
+        from python.neuro_rpc._json_encoders import dumps
+        return dumps(obj)
+
+    # Actor message priority and initial exec_time sent with every request
+    # (NumPy scalars are immutable, so one instance of each is shared)
+    PRIORITY = np.int32(2)
+    EXEC_TIME = np.int32(0)
+
+    # Keys of the Actor cluster and of its nested Data cluster
+    ACTOR_KEYS = ["Class name", "Priority", "Data"]
+    DATA_KEYS = ["Message", "id", "exec_time"]
+
+    def __init__(self, id_mode: str = "ascii"):
+        """
+        Initialize the Proxy with empty per-method caches.
+
+        Args:
+            id_mode (str): How request ids are flattened: ``"ascii"`` (36-character UUID
+                text, default) or ``"bytes"`` (the 16 raw UUID bytes). The id field is a
+                LabVIEW string either way, so the cluster type is unchanged; the server
+                tells the modes apart by length. ``"bytes"`` applies to string messages
+                with canonical UUID ids; other ids are flattened as sent.
+
+        Raises:
+            ValueError: If ``id_mode`` is not one of ``ID_MODES``.
+        """
+        if id_mode not in ID_MODES:
+            raise ValueError(f"Unsupported id_mode '{id_mode}', expected one of {ID_MODES}")
+        self.id_mode = id_mode
+
+        self._class_names = {}
+        self._act_templates = {}
+        self._act_tree_ids = set()  # id() of cached template trees (kept alive by _act_templates)
 
     def dict_to_tuple(self, d: dict) -> tuple[list, list]:
         """
         Convert a dictionary into a (values, keys) tuple.
 
-        Recursively descends into nested dictionaries to preserve structure.
+        Nested dictionaries are converted as well, walking the structure with an
+        explicit stack instead of recursion.
 
         Args:
             d (dict): Input dictionary.
@@ -67,20 +206,25 @@ class Proxy(ClusterConverter):
         Returns:
             tuple[list, list]: (values, keys) representation of the dictionary.
         """
-        keys = list(d.keys())
-        values = []
-        for k in keys:
-            v = d[k]
-            if isinstance(v, dict):
-                v = self.dict_to_tuple(v)
-            values.append(v)
-        return values, keys
+        root = ([], list(d))
+        stack = [(d, root[0])]
+        while stack:
+            src, values = stack.pop()
+            for v in src.values():
+                if isinstance(v, dict):
+                    child = ClusterTuple(([], list(v)))
+                    stack.append((v, child[0]))
+                    v = child
+                values.append(v)
+        return root
 
     def tuple_to_dict(self, values_keys) -> dict:
         """
         Convert a (values, keys) tuple back into a dictionary.
 
-        Recursively reconstructs nested dictionaries from tuple representations.
+        Nested ``ClusterTuple`` values (or plain ``([...], [...])`` tuples) are
+        reconstructed as dictionaries as well, walking the structure with an explicit
+        stack instead of recursion.
 
         Args:
             values_keys (tuple[list, list]): (values, keys) pair.
@@ -89,38 +233,39 @@ class Proxy(ClusterConverter):
             dict: Reconstructed dictionary.
         """
         values, keys = values_keys
-        result = {}
-        for key, val in zip(keys, values):
-            if (
-                isinstance(val, tuple)
-                and len(val) == 2
-                and isinstance(val[0], list)
-                and isinstance(val[1], list)
-            ):
-                result[key] = self.tuple_to_dict(val)
-            else:
-                result[key] = val
-        return result
+        root = {}
+        stack = [(values, keys, root)]
+        while stack:
+            values, keys, result = stack.pop()
+            for key, val in zip(keys, values):
+                kind = type(val)
+                if kind is ClusterTuple or (kind is tuple and len(val) == 2
+                                            and type(val[0]) is list and type(val[1]) is list):
+                    child = result[key] = {}
+                    stack.append((val[0], val[1], child))
+                else:
+                    result[key] = val
+        return root
 
     def to_cluster_bytes_with_tree(
         self,
         tup: tuple[list, list],
-        sdata: SerializationData = None,
-        encoding: str = "ansi"
+        sdata: SerializationData = None
     ) -> tuple[bytes, dict]:
         """
         Serialize a (values, keys) tuple into a LabVIEW Cluster flat buffer.
 
+        Nested clusters are embedded as strings holding their raw flat buffer.
+
         Args:
             tup (tuple[list, list]): (values, keys) representation of the cluster.
             sdata (SerializationData, optional): Serialization metadata. Defaults to version=0.
-            encoding (str): Encoding to use for nested buffers. Defaults to "ansi".
 
         Returns:
             tuple[bytes, dict]: (flat buffer, metadata tree).
         """
         if sdata is None:
-            sdata = SerializationData(version=0)
+            sdata = _DEFAULT_SDATA
 
         values, keys = tup
         processed = []
@@ -128,18 +273,15 @@ class Proxy(ClusterConverter):
 
         for idx, v in enumerate(values):
             if isinstance(v, tuple):
-                buf_str, subtree = self.to_cluster_bytes_with_tree(v, sdata, encoding)
-                processed.append(buf_str.decode(encoding))
-                children.append({
-                    "index": idx,
-                    "keys": v[1],
-                    "tree": subtree
-                })
+                buf, subtree = self.to_cluster_bytes_with_tree(v, sdata)
+                processed.append(buf)
+                children.append(TreeChild(idx, v[1], subtree))
             else:
                 processed.append(v)
 
-        cluster = Cluster(processed, keys)
-        res = ClusterConverter.serialize(cluster, sdata)
+        # Item names are never flattened (keys live in the tree), so serialize the
+        # item list directly instead of building a throwaway Cluster around it
+        res = ClusterConverter.serialize(processed, sdata)
 
         return (
             res.flat_buffer(),
@@ -154,24 +296,23 @@ class Proxy(ClusterConverter):
         self,
         raw_bytes: bytes,
         hdr_tree: dict,
-        sdata: SerializationData = None,
-        encoding: str = "ansi"
+        sdata: SerializationData = None
     ) -> tuple[list, list]:
         """
         Reconstruct a (values, keys) tuple from Cluster bytes and metadata tree.
 
         Args:
-            raw_bytes (bytes): Flat buffer for the cluster.
-            hdr_tree (dict): Metadata tree including headers, keys, and children.
+            raw_bytes (bytes | memoryview): Flat buffer for the cluster.
+            hdr_tree (dict): Metadata tree including headers, keys, and children (``TreeChild`` entries).
             sdata (SerializationData, optional): Deserialization context.
-            encoding (str): Encoding used for string payloads. Defaults to "ansi".
 
         Returns:
             tuple[list, list]: (values, keys) structure.
         """
         if sdata is None:
-            sdata = SerializationData(version=0)
+            sdata = _DEFAULT_SDATA
 
+        # The only copy of the data at each level: nested buffers are passed down as views
         full = hdr_tree["header"] + raw_bytes
         hi = HeaderInfo.parse(full, offset_h=0)
         dd = DeserializationData(
@@ -181,17 +322,51 @@ class Proxy(ClusterConverter):
             version=sdata.version
         )
 
-        vals = list(ClusterConverter.deserialize(dd).value)
+        children = hdr_tree.get("children", [])
+        vals = self._deserialize_items(dd, {child.index for child in children})
         keys = hdr_tree["keys"]
 
-        for child in hdr_tree.get("children", []):
-            idx = child["index"]
-            sub_tree = child["tree"]
-            buf_sub = vals[idx].encode(encoding)
-            vals[idx] = self.from_cluster_bytes_and_tree(buf_sub, sub_tree, sdata, encoding)
+        for idx, _, tree in children:
+            vals[idx] = ClusterTuple(self.from_cluster_bytes_and_tree(vals[idx], tree, sdata))
 
         return vals, keys
 
+    @staticmethod
+    def _deserialize_items(dd: DeserializationData, raw_indices) -> list:
+        """
+        Deserialize the items of a cluster, keeping some string items as raw bytes.
+
+        Mirrors ``ClusterConverter._deserialize``, except that the items at
+        ``raw_indices`` (nested cluster buffers) are returned as zero-copy views into
+        the buffer instead of being decoded as text.
+
+        Args:
+            dd (DeserializationData): Deserialization context positioned on the cluster.
+            raw_indices (set[int]): Indices of string items to return as ``memoryview``.
+
+        Returns:
+            list: Item values.
+        """
+        buffer = dd.buffer
+        view = memoryview(buffer)
+        n_items, offset_h = bytes2num(buffer, offset=dd.header.offset_h, dtype=LVDtypes.u2, count=1)
+        offset_d = dd.offset_d
+
+        vals = []
+        for i in range(n_items):
+            item_header, offset_h = dd.parse_header(offset_h)
+            if i in raw_indices:
+                size, = _U32.unpack_from(buffer, offset_d)
+                offset_d += 4
+                vals.append(view[offset_d:offset_d + size])
+                offset_d += size
+            else:
+                item = item_header.converter.deserialize(dd.fork(header=item_header, offset_d=offset_d))
+                vals.append(item.value)
+                offset_d = item.offset_d
+
+        return vals
+
     def to_act(self, Message):
         """
         Convert an RPCRequest/Message dict into a LabVIEW Actor Cluster.
@@ -201,22 +376,106 @@ class Proxy(ClusterConverter):
 
         Returns:
             tuple[bytes, dict]: (flat buffer, metadata tree).
+
+        Notes:
+            Only the nested Data buffer depends on the message and id. The rest of the
+            flattened Actor (class name, priority) and the metadata tree are computed
+            once per method (see ``_act_template``) and string messages are patched in.
         """
         if isinstance(Message, RPCRequest):
             Message = Message.to_dict()
 
-        id = Message.pop("id")
-        Message["params"] = {"id": id, **Message["params"]}
+        method = Message["method"]
+        message = Message["params"]["Message"]
+        template = self._act_templates.get(method)
+        if template is None:
+            template = self._act_templates[method] = self._act_template(method)
+        if not template or type(message) is not str:
+            return self._flatten_act(method, message, Message["id"])
+
+        prefix, hdr_tree = template
+        msg = _encode_message(message)
+        if self.id_mode == "bytes":
+            request_id = _uuid_bytes(Message["id"])
+            if request_id is None:
+                # Not a UUID: flatten as sent, with a tree whose decoding skips the 16-byte check
+                return self._flatten_act(method, message, Message["id"])
+        else:
+            request_id = Message["id"].encode(LVDtypes.codepage)
+        pack = _U32.pack
+
+        # Data = [len][Message] [len][id] [exec_time]
+        data_len = len(msg) + len(request_id) + 3 * _U32.size
+        return b"".join((prefix, pack(data_len), pack(len(msg)), msg,
+                         pack(len(request_id)), request_id, pack(0))), hdr_tree
+
+    def _act_template(self, method):
+        """
+        Flatten an empty Actor for ``method`` and split off its constant prefix.
+
+        Args:
+            method (str): RPC method name.
+
+        Returns:
+            tuple[bytes, dict] | bool: ``(prefix, hdr_tree)``, where ``prefix`` ends right
+            before the Data buffer's length, or ``False`` if the flattened layout is not
+            the expected one (``to_act`` then always takes the generic path).
+        """
+        flat, hdr_tree = self._flatten_act(method, "", "")
+
+        data = _U32.pack(0) * 3  # Empty Message, empty id, exec_time 0
+        tail = _U32.pack(len(data)) + data
+        if not flat.endswith(tail):
+            return False
 
-        self.Actor["Class name"] = f"Chat Window.lvlib:{Message['method']} Msg.lvclass"
-        self.Actor["Data"] = {
-            "Message": Message["params"]["Message"],
-            "id": Message["params"]["id"],
-            "exec_time": np.int32(0)
-        }
-        tupla = self.dict_to_tuple(self.Actor)
+        hdr_tree = self._freeze_tree(hdr_tree)
+        self._act_tree_ids.add(id(hdr_tree))
+        return flat[:-len(tail)], hdr_tree
+
+    @staticmethod
+    def _freeze_tree(hdr_tree: dict):
+        """
+        Return a read-only copy of a metadata tree.
+
+        Template trees are cached and handed to every caller of ``to_act`` for that
+        method, so they are frozen to keep one caller from corrupting the others.
+
+        Args:
+            hdr_tree (dict): Metadata tree from ``to_cluster_bytes_with_tree``.
+
+        Returns:
+            types.MappingProxyType: Tree with read-only mappings and tuples for lists.
+        """
+        children = tuple(
+            TreeChild(child.index, tuple(child.keys), Proxy._freeze_tree(child.tree))
+            for child in hdr_tree["children"]
+        )
+        return types.MappingProxyType({
+            "header": hdr_tree["header"],
+            "keys": tuple(hdr_tree["keys"]),
+            "children": children,
+        })
+
+    def _flatten_act(self, method, message, id):
+        """
+        Flatten an Actor cluster for ``method`` through the generic cluster serializer.
+
+        Args:
+            method (str): RPC method name.
+            message (Any): Value of the Data ``Message`` field.
+            id (str): Request id.
+
+        Returns:
+            tuple[bytes, dict]: (flat buffer, metadata tree).
+        """
+        class_name = self._class_names.get(method)
+        if class_name is None:
+            class_name = self._class_names[method] = f"Chat Window.lvlib:{method} Msg.lvclass"
+
+        # (values, keys) form of the Actor, as dict_to_tuple would build it
+        data = [message, id, self.EXEC_TIME]
+        tupla = ([class_name, self.PRIORITY, ClusterTuple((data, self.DATA_KEYS))], self.ACTOR_KEYS)
 
-        self.to_cluster_bytes_with_tree(tupla)
         return self.to_cluster_bytes_with_tree(tupla)
 
     def from_act(self, raw_bytes: bytes, hdr_tree: dict):
@@ -228,13 +487,70 @@ class Proxy(ClusterConverter):
             hdr_tree (dict): Metadata tree from serialization.
 
         Returns:
-            dict: RPCResponse serialized as dictionary.
+            dict: RPCResponse serialized as dictionary, holding only native Python types.
+
+        Notes:
+            Responses to requests flattened from a cached template (string messages, see
+            ``to_act``) have a known layout; their Data fields are read directly at
+            their offsets instead of deserializing the whole cluster tree.
         """
+        if id(hdr_tree) in self._act_tree_ids:
+            try:
+                id_, result = self._read_act_data(raw_bytes)
+            except (struct.error, ValueError):
+                pass  # Not the expected layout; let the generic path handle (and report) it
+            else:
+                return RPCResponse(id=id_, result=result).to_dict()
+
         recovered_vals, recovered_keys = self.from_cluster_bytes_and_tree(raw_bytes, hdr_tree)
         dict_ = self.tuple_to_dict((recovered_vals, recovered_keys))
-        id = dict_["Data"].pop("id")
+        id_ = to_builtin(dict_["Data"].pop("id"))
+
+        return RPCResponse(id=id_, result=to_builtin(dict_["Data"])).to_dict()
+
+
+    def _read_act_data(self, raw_bytes):
+        """
+        Read the Data fields of a flattened Actor whose Message is a string.
 
-        return RPCResponse(id=id, result=dict_["Data"]).to_dict()
+        Layout: ``[len][Class name] [Priority] [len][Data]`` with
+        ``Data = [len][Message] [len][id] [exec_time]``.
+
+        Args:
+            raw_bytes (bytes | memoryview): Cluster flat buffer.
+
+        Returns:
+            tuple[str, dict]: ``(id, {"Message": ..., "exec_time": ...})``.
+
+        Raises:
+            struct.error: If the buffer is too short.
+            ValueError: If a length runs past the end of the buffer.
+        """
+        codepage = LVDtypes.codepage
+        unpack_u32 = _U32.unpack_from
+
+        offset = 4 + unpack_u32(raw_bytes, 0)[0] + 4  # Skip Class name and Priority
+        data_end = offset + 4 + unpack_u32(raw_bytes, offset)[0]
+        offset += 4
+
+        size, = unpack_u32(raw_bytes, offset)
+        offset += 4
+        message = str(raw_bytes[offset:offset + size], codepage)
+        offset += size
+
+        size, = unpack_u32(raw_bytes, offset)
+        offset += 4
+        if size == 16 and self.id_mode == "bytes":  # Raw UUID bytes
+            id_ = str(uuid.UUID(bytes=bytes(raw_bytes[offset:offset + size])))
+        else:
+            id_ = str(raw_bytes[offset:offset + size], codepage)
+        offset += size
+
+        exec_time, = _I32.unpack_from(raw_bytes, offset)
+        if offset + 4 != data_end or data_end > len(raw_bytes):
+            raise ValueError("Unexpected Actor Data layout")
+
+        return id_, {"Message": message, "exec_time": exec_time}
 
 
 if __name__ == '__main__':
@@ -11,6 +11,7 @@ Notes:
     - Acts as the bridge between raw JSON messages and Python method calls.
 """
 import inspect
+import itertools
 from typing import Callable, Dict, Any, Optional, Union
 
 from python.neuro_rpc.Benchmark import Benchmark
@@ -18,6 +19,16 @@ from python.neuro_rpc.RPCMessage import RPCMessage, RPCRequest, RPCResponse, RPC
 from python.neuro_rpc.Logger import Logger
 import uuid
 
+# orjson parses str and UTF-8 bytes directly; the stdlib parser is the fallback
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+class _InvalidParams(Exception):
+    """Raised by a generated dispatch stub when a request lacks required params."""
+
 
 def rpc_method(method_type: str = "both", name: Optional[str] = None):
     """
@@ -64,9 +75,14 @@ class RPCHandler(RPCMessage):
         super().__init__()
         self.request_methods: Dict[str, Callable] = {}
         self.response_methods: Dict[str, Callable] = {}
-        self._request_id = 0
+        self._request_stubs: Dict[str, tuple] = {}  # method name -> (callback, dispatch stub)
+        self._request_ids = itertools.count(1)
+        # Random per-handler UUID prefix; request ids append the counter to it
+        self._id_prefix = str(uuid.uuid4())[:19]
         self.tracker = Benchmark()
         self.logger = Logger.get_logger(self.__class__.__name__)
+        # Bound once so subclass overrides are honored and a bad table entry fails here
+        self._dispatchers = {kind: getattr(self, name) for kind, name in self._MESSAGE_KINDS.items()}
 
     def register_methods(self, instance) -> None:
         """
@@ -88,8 +104,8 @@ class RPCHandler(RPCMessage):
                 if method_type in ["response", "both"]:
                     self.register_response(method_name, method)
 
-        self.logger.debug(f"Registered request methods: {list(self.request_methods.keys())}")
-        self.logger.debug(f"Registered response methods: {list(self.response_methods.keys())}")
+        self.logger.debug("Registered request methods: %s", list(self.request_methods))
+        self.logger.debug("Registered response methods: %s", list(self.response_methods))
 
     def register_request(self, method_name: str, method: Callable) -> None:
         """
@@ -105,10 +121,52 @@ class RPCHandler(RPCMessage):
         if not callable(method):
             raise ValueError(f"Request handler for {method_name} must be callable")
 
+        stub = self._build_stub(method_name, method)
+
         if method_name in self.request_methods:
             self.logger.warning(f"Overriding existing request method: {method_name}")
 
         self.request_methods[method_name] = method
+        self._request_stubs[method_name] = (method, stub)
+
+    @staticmethod
+    def _build_stub(method_name: str, method: Callable) -> Callable:
+        """
+        Generate a dispatch function specialized to a request handler's signature.
+
+        The handler's required parameter names are written into the generated source as
+        ``repr`` literals, so checking a request's params costs a few ``in`` tests instead of
+        a signature walk. Params are passed on unchanged (``**params`` / ``*params``).
+
+        Args:
+            method_name (str): Name of the RPC method (only used in the stub's filename).
+            method (Callable): Request handler.
+
+        Returns:
+            Callable: ``stub(callback, params)`` returning the handler's result, or
+            raising ``_InvalidParams`` when required params are missing.
+        """
+        required = [name for name, param in inspect.signature(method).parameters.items()
+                    if param.default is inspect.Parameter.empty and name != 'self']
+
+        missing_test = " or ".join(f"{name!r} not in params" for name in required) or "False"
+        src = (
+            "def stub(callback, params):\n"
+            "    if isinstance(params, dict):\n"
+            f"        if {missing_test}:\n"
+            "            raise _InvalidParams('Missing required parameters: '\n"
+            "                                 + ', '.join([n for n in required if n not in params]))\n"
+            "        return callback(**params)\n"
+            "    if isinstance(params, list):\n"
+            f"        if len(params) < {len(required)}:\n"
+            f"            raise _InvalidParams(f'Method requires {len(required)} positional arguments, "
+            "got {len(params)}')\n"
+            "        return callback(*params)\n"
+            "    return callback()\n"
+        )
+        namespace = {"_InvalidParams": _InvalidParams, "required": tuple(required)}
+        exec(compile(src, f"<rpc:{method_name!r}>", "exec"), namespace)
+        return namespace["stub"]
 
     def register_response(self, method_name: str, method: Callable) -> None:
         """
@@ -136,8 +194,7 @@ class RPCHandler(RPCMessage):
         Returns:
             int: Incremental request ID.
         """
-        self._request_id += 1
-        return self._request_id
+        return next(self._request_ids)
 
     def create_request(self, method, params=None, request_id=None):
         """
@@ -146,13 +203,15 @@ class RPCHandler(RPCMessage):
         Args:
             method (str): Method name to call.
             params (dict | list, optional): Parameters for the request.
-            request_id (str, optional): Custom request ID (UUID by default).
+            request_id (str, optional): Custom request ID. By default a UUID-formatted id
+                made of a random per-handler prefix and the request counter.
 
         Returns:
             dict: Serialized request object.
         """
         if request_id is None:
-            request_id = str(uuid.uuid4())
+            n = next(self._request_ids)
+            request_id = f"{self._id_prefix}{n >> 48 & 0xFFFF:04x}-{n & 0xFFFFFFFFFFFF:012x}"
 
         request = RPCRequest(method=method, id=request_id, params=params)
         request_dict = request.to_dict()
@@ -201,15 +260,16 @@ class RPCHandler(RPCMessage):
 
         return response.to_dict()
 
-    def process_message(self, message: Union[Dict[str, Any], str, RPCMessage]) -> Optional[Dict[str, Any]]:
+    def process_message(self, message: Union[Dict[str, Any], str, bytes, RPCMessage]) -> Optional[Dict[str, Any]]:
         """
         Process an incoming JSON-Message.
 
-        Parses input (string/dict/RPCMessage), converts to RPCRequest or RPCResponse,
-        and dispatches to the appropriate handler.
+        Parses input (JSON string/bytes or dict), converts to RPCRequest or RPCResponse,
+        and dispatches to the appropriate handler. JSON bytes read from a socket are
+        parsed as-is, without decoding them to ``str`` first.
 
         Args:
-            message (dict | str | RPCMessage): Incoming message.
+            message (dict | str | bytes | RPCMessage): Incoming message.
 
         Returns:
             dict | None: Response dict if request, None if response.
@@ -218,41 +278,67 @@ class RPCHandler(RPCMessage):
             RPCError: If message is invalid or cannot be parsed.
         """
         try:
-            if isinstance(message, str):
+            if isinstance(message, (str, bytes, bytearray)):
                 try:
-                    import json
-                    message = json.loads(message)
+                    message = _json.loads(message)
                 except Exception as e:
                     self.logger.error(f"JSON parse error: {e}")
                     return self.create_error(RPCError.PARSE_ERROR)
 
-            if isinstance(message, dict):
-                if "method" in message:
-                    try:
-                        rpc_message = RPCRequest.from_dict(message)
-                    except Exception:
-                        return self.create_error(RPCError.INVALID_REQUEST)
-                elif "result" in message or "error" in message:
-                    try:
-                        rpc_message = RPCResponse.from_dict(message)
-                    except Exception:
-                        return self.create_error(RPCError.INVALID_REQUEST)
-                else:
-                    return self.create_error(RPCError.INVALID_REQUEST)
-            else:
+            if not isinstance(message, dict):
                 return self.create_error(RPCError.INVALID_REQUEST)
 
-            if isinstance(rpc_message, RPCRequest):
-                return self._process_request(rpc_message)
-            elif isinstance(rpc_message, RPCResponse):
-                self._process_response(rpc_message)
-                return None
-            else:
+            kind = "method" if "method" in message else (
+                "result" if "result" in message else ("error" if "error" in message else None))
+            if kind is None:
                 return self.create_error(RPCError.INVALID_REQUEST)
+
+            return self._dispatchers[kind](message)
         except Exception as e:
             self.logger.error(f"Error processing message: {e}", exc_info=True)
             return self.create_error(RPCError.INTERNAL_ERROR, data=str(e))
 
+    def _dispatch_request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build an RPCRequest from a parsed message and process it.
+
+        Args:
+            message (dict): Parsed message holding a ``method`` key.
+
+        Returns:
+            dict: Serialized response or error.
+        """
+        try:
+            request = RPCRequest.from_dict(message)
+        except Exception:
+            return self.create_error(RPCError.INVALID_REQUEST)
+        return self._process_request(request)
+
+    def _dispatch_response(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Build an RPCResponse from a parsed message and process it.
+
+        Args:
+            message (dict): Parsed message holding a ``result`` or ``error`` key.
+
+        Returns:
+            dict | None: Error dict if the message is malformed, None otherwise.
+        """
+        try:
+            response = RPCResponse.from_dict(message)
+        except Exception:
+            return self.create_error(RPCError.INVALID_REQUEST)
+        self._process_response(response)
+        return None
+
+    # Message kind (first key found of method/result/error) -> dispatcher method name,
+    # bound per instance in __init__ so subclasses can override the dispatchers
+    _MESSAGE_KINDS = {
+        "method": "_dispatch_request",
+        "result": "_dispatch_response",
+        "error": "_dispatch_response",
+    }
+
     def _process_request(self, request: Union[Dict[str, Any], RPCRequest]) -> Dict[str, Any]:
         """
         Process an incoming RPCRequest.
@@ -285,28 +371,14 @@ class RPCHandler(RPCMessage):
         params = request.params or {}
 
         try:
-            sig = inspect.signature(callback)
-
-            if isinstance(params, dict):
-                missing_params = []
-                for param_name, param in sig.parameters.items():
-                    if param.default == inspect.Parameter.empty and param_name not in params and param_name != 'self':
-                        missing_params.append(param_name)
-
-                if missing_params:
-                    error_data = f"Missing required parameters: {', '.join(missing_params)}"
-                    return self.create_error(RPCError.INVALID_PARAMS, data=error_data, id=request.id)
-                result = callback(**params)
-            elif isinstance(params, list):
-                required_count = sum(1 for param in sig.parameters.values()
-                                     if param.default == inspect.Parameter.empty and param.name != 'self')
-
-                if len(params) < required_count:
-                    error_data = f"Method requires {required_count} positional arguments, got {len(params)}"
-                    return self.create_error(RPCError.INVALID_PARAMS, data=error_data, id=request.id)
-                result = callback(*params)
-            else:
-                result = callback()
+            entry = self._request_stubs.get(method)
+            if entry is None or entry[0] is not callback:  # Set without register_request()
+                entry = self._request_stubs[method] = (callback, self._build_stub(method, callback))
+
+            try:
+                result = entry[1](callback, params)
+            except _InvalidParams as e:
+                return self.create_error(RPCError.INVALID_PARAMS, data=str(e), id=request.id)
 
             if request.id is not None:
                 self.tracker.track_incoming_request(request)
@@ -11,7 +11,7 @@ Notes:
 from typing import Any
 import json
 
-from python.neuro_rpc import logger
+import python.neuro_rpc as neuro_rpc  # neuro_rpc.logger is created on first use
 from python.neuro_rpc.RPCHandler import RPCHandler, rpc_method
 
 
@@ -59,7 +59,7 @@ class RPCMethods(RPCHandler):
             error (Any, optional): Error object if the request failed.
         """
         if error:
-            logger.error(f"Echo operation failed: {error}")
+            neuro_rpc.logger.error(f"Echo operation failed: {error}")
         else:
             pass
 
@@ -88,9 +88,9 @@ class RPCMethods(RPCHandler):
             error (Any, optional): Error object if the request failed.
         """
         if error:
-            logger.error(f"Add operation failed: {error}")
+            neuro_rpc.logger.error(f"Add operation failed: {error}")
         else:
-            logger.debug(f"Add operation result: {result}")
+            neuro_rpc.logger.debug("Add operation result: %s", result)
 
     @rpc_method(method_type="request")
     def subtract(self, a: float, b: float) -> float:
@@ -117,9 +117,9 @@ class RPCMethods(RPCHandler):
             error (Any, optional): Error object if the request failed.
         """
         if error:
-            logger.error(f"Subtract operation failed: {error}")
+            neuro_rpc.logger.error(f"Subtract operation failed: {error}")
         else:
-            logger.debug(f"Subtract operation result: {result}")
+            neuro_rpc.logger.debug("Subtract operation result: %s", result)
 
     @rpc_method(method_type="response", name="default")
     def default_response_handler(self, id: Any = None, result: Any = None, error: Any = None) -> None:
@@ -134,9 +134,9 @@ class RPCMethods(RPCHandler):
             error (Any, optional): Error payload if failure.
         """
         if error:
-            logger.warning(f"Unhandled response error for ID {id}: {error}")
+            neuro_rpc.logger.warning(f"Unhandled response error for ID {id}: {error}")
         else:
-            logger.debug(f"Unhandled response result for ID {id}: {result}")
+            neuro_rpc.logger.debug("Unhandled response result for ID %s: %s", id, result)
 
 
 if __name__ == "__main__":
@@ -136,7 +136,7 @@ class RPCTracker:
                 if now - last_cleanup > self.cleanup_interval:
                     cleaned = self.clean_tracking_data(self.cleanup_interval)
                     if self.logger and cleaned > 0:
-                        self.logger.debug(f"Cleaned {cleaned} old tracking entries")
+                        self.logger.debug("Cleaned %d old tracking entries", cleaned)
                     last_cleanup = now
 
                 self._should_stop.wait(self.monitor_interval)
@@ -166,7 +166,7 @@ class RPCTracker:
             request (RPCRequest): Request object received.
         """
         with self._tracking_lock:
-            self.logger.debug(f"Tracking incoming request: {request}")
+            self.logger.debug("Tracking incoming request: %s", request)
             self.incoming_requests[request.id] = (time.time(), request.method)
             self.stats["incoming_requests_count"] += 1
 
@@ -178,7 +178,7 @@ class RPCTracker:
             response (RPCResponse): Response object being sent.
         """
         with self._tracking_lock:
-            self.logger.debug(f"Tracking outgoing response: {response.id}, {response.is_success}")
+            self.logger.debug("Tracking outgoing response: %s, %s", response.id, response.is_success)
             if response.id in self.incoming_requests:
                 del self.incoming_requests[response.id]
             self.outgoing_responses[response.id] = (time.time(), response.is_success)
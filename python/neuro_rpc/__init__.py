@@ -6,8 +6,18 @@ __all__ = ['logger']
 
 from python.neuro_rpc.Logger import Logger
 
-# Initialize a Logger instance
-logger = Logger.get_logger("__neuro__")
+
+def __getattr__(name):
+    """
+    Create the package ``logger`` on first access rather than at import time.
+
+    Building a Logger starts the log listener and flusher threads, so importing the
+    package alone does not.
+    """
+    if name == "logger":
+        logger = globals()["logger"] = Logger.get_logger("__neuro__")
+        return logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     pass
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+JSON encoding helpers for NumPy-aware RPC payloads.
+
+Holds the JSON side of the NeuroRPC stack so that ``Proxy`` (LabVIEW Cluster
+flattening) does not need to import any JSON machinery.
+
+Notes:
+    - ``dumps`` prefers orjson when installed and falls back to ``json`` with ``NpEncoder``.
+"""
+import json
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class NpEncoder(json.JSONEncoder):
+    """
+    JSON encoder for NumPy data types.
+
+    Converts ``numpy.integer``, ``numpy.floating``, and ``numpy.ndarray`` into standard
+    Python ``int``, ``float``, and ``list`` for JSON serialization compatibility.
+    """
+    def default(self, obj):
+        """
+        Override JSON encoding for NumPy objects.
+
+        Args:
+            obj (Any): Object to encode.
+
+        Returns:
+            Any: Encoded Python-native type.
+        """
+        if isinstance(obj, np.integer):
+            return int(obj)
+        if isinstance(obj, np.floating):
+            return float(obj)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        return super().default(obj)
+
+
+if orjson is not None:
+    def dumps(obj) -> bytes:
+        """
+        Serialize ``obj`` to UTF-8 JSON bytes, encoding NumPy values natively.
+
+        Uses orjson when installed and falls back to ``json`` with ``NpEncoder``.
+
+        Args:
+            obj (Any): Object to serialize.
+
+        Returns:
+            bytes: JSON document.
+        """
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+else:
+    def dumps(obj) -> bytes:
+        """
+        Serialize ``obj`` to UTF-8 JSON bytes, encoding NumPy values natively.
+
+        Uses orjson when installed and falls back to ``json`` with ``NpEncoder``.
+
+        Args:
+            obj (Any): Object to serialize.
+
+        Returns:
+            bytes: JSON document.
+        """
+        return json.dumps(obj, cls=NpEncoder).encode('utf-8')
@@ -0,0 +1,106 @@
+import json
+import math
+
+import numpy as np
+import pytest
+
+from python.neuro_rpc.Benchmark import Benchmark
+from python.neuro_rpc.RPCMessage import RPCRequest, RPCResponse
+
+METRICS = ('exec_time', 'total_latency', 'network_latency')
+
+
+def expected_stats(run):
+    """Statistics as computed before the running sums (``np.mean`` over every sample)."""
+    samples = run.samples.values()
+    return {f"avg_{m}": np.mean([s.metrics[m] for s in samples]) for m in METRICS}
+
+
+def request(bench, rid, raw=False):
+    bench.track_outgoing_request(RPCRequest("echo", id=rid, params={"Message": rid}), raw=raw)
+
+
+def respond(bench, rid, exec_time, raw=False):
+    bench.track_incoming_response(RPCResponse(rid, result={"Message": rid}, exec_time=exec_time), raw=raw)
+
+
+@pytest.fixture
+def bench():
+    return Benchmark(autostart=False)
+
+
+def test_stats_match_mean_over_samples(bench):
+    bid = bench.start_benchmark()
+    for i in range(5):
+        request(bench, f"r{i}")
+    respond(bench, "r0", 1500)
+    respond(bench, "r1", 250)
+    respond(bench, "r1", 900)       # Duplicate response replaces the first one
+    respond(bench, "r2", 400)
+    bench.set_exec_time("r2", 7000)  # Exec time overridden after the response
+    bench.set_exec_time("r3", 300)   # ... and before any response arrived
+    # r4 stays unanswered and counts as zero
+    run = bench.data[bid]
+    bench.stop_benchmark()
+
+    assert run.stats['samples_count'] == 5
+    assert run.samples["r1"].metrics['exec_time'] == 0.9
+    assert run.samples["r2"].metrics['exec_time'] == 7.0
+    assert run.samples["r4"].metrics == dict.fromkeys(METRICS, 0)
+    for key, value in expected_stats(run).items():
+        assert run.stats[key] == pytest.approx(value), key
+
+
+def test_stats_ignore_responses_after_stop(bench):
+    bid = bench.start_benchmark()
+    request(bench, "a")
+    respond(bench, "a", 100)
+    bench.stop_benchmark()
+    stats = dict(bench.data[bid].stats)
+
+    respond(bench, "a", 5000)
+    bench.set_exec_time("a", 5000)
+
+    assert bench.data[bid].stats == stats
+
+
+def test_empty_run_stats_are_nan(bench):
+    bid = bench.start_benchmark()
+    bench.stop_benchmark()
+
+    stats = bench.data[bid].stats
+    assert stats['samples_count'] == 0
+    for m in METRICS:
+        assert math.isnan(stats[f"avg_{m}"])
+
+
+def test_exports_agree_on_raw_messages(bench, tmp_path):
+    pd = pytest.importorskip("pandas")
+    bench.start_benchmark("first")
+    request(bench, "a", raw=True)
+    request(bench, "b")               # No raw kept for this request
+    respond(bench, "a", 100, raw=True)
+    bench.stop_benchmark()
+    bench.start_benchmark("empty")
+    bench.stop_benchmark()
+    bench.start_benchmark("second")
+    request(bench, "c", raw=True)
+    respond(bench, "c", 50)           # No raw kept for this response
+    bench.stop_benchmark()
+
+    bench.export('csv', filename=str(tmp_path / "bench"))
+    bench.export('json', filename=str(tmp_path / "bench"))
+    df = bench.data_to_dataframe()
+    df.to_csv(tmp_path / "frame.csv", index=False)
+
+    streamed = pd.read_csv(tmp_path / "bench.csv")
+    pd.testing.assert_frame_equal(streamed, pd.read_csv(tmp_path / "frame.csv"))
+    assert list(streamed["sample_id"]) == ["a", "b", "c"]
+
+    with open(tmp_path / "bench.json") as f:
+        exported = json.load(f)
+    for row in df.itertuples():
+        sample = exported[row.benchmark_id]["samples"][row.sample_id]
+        for side in ("request", "response"):
+            raw = getattr(row, f"{side}_raw")
+            assert (None if pd.isna(raw) else json.loads(raw)) == sample[side]["raw"]
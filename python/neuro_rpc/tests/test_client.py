@@ -0,0 +1,330 @@
+import asyncio
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from python.neuro_rpc.AsyncClient import AsyncClient
+from python.neuro_rpc.Client import Client, ClientPool, ConnectionError, TimeoutError
+
+EXEC_TIME = 123
+
+
+def recv_exactly(conn, n):
+    data = b""
+    while len(data) < n:
+        chunk = conn.recv(n - len(data))
+        if not chunk:
+            raise EOFError
+        data += chunk
+    return data
+
+
+class EchoServer:
+    """
+    Loopback server that echoes framed packets with ``EXEC_TIME`` in the trailer.
+
+    ``replies_per_conn`` closes each connection after that many replies, to exercise
+    reconnects. ``batch`` collects that many requests and answers them in reverse
+    order, to exercise pipelined clients. ``reply`` maps each request body (without
+    its trailer) to the payload sent back.
+    """
+    def __init__(self, replies_per_conn=None, batch=1, reply=None):
+        self.replies_per_conn = replies_per_conn
+        self.batch = batch
+        self.reply = reply or (lambda body: body)
+        self.connections = 0
+        self._sock = socket.create_server(("127.0.0.1", 0))
+        self.port = self._sock.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        replies = 0
+        try:
+            while self.replies_per_conn is None or replies < self.replies_per_conn:
+                bodies = []
+                for _ in range(self.batch):
+                    size, = struct.unpack(">I", recv_exactly(conn, 4))
+                    bodies.append(recv_exactly(conn, size)[:-4])
+                for body in reversed(bodies):
+                    payload = self.reply(body) + struct.pack(">I", EXEC_TIME)
+                    conn.sendall(struct.pack(">I", len(payload)) + payload)
+                replies += self.batch
+        except (EOFError, OSError):
+            pass
+        finally:
+            conn.close()
+
+    def close(self):
+        self._sock.close()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_client_reconnects_after_server_closes():
+    srv = EchoServer(replies_per_conn=1)
+    client = Client(port=srv.port, retry_delay=0.05)
+    client.start()
+    try:
+        assert wait_for(lambda: client.connected)
+
+        size, response, tail = client.rpc("echo", {"Message": "first"})
+        assert tail == EXEC_TIME
+
+        # The server closed the connection after its reply
+        with pytest.raises(ConnectionError):
+            client.rpc("echo", {"Message": "lost"})
+
+        assert wait_for(lambda: client.connected and srv.connections == 2)
+        size, response, tail = client.rpc("echo", {"Message": "again"})
+        assert tail == EXEC_TIME
+    finally:
+        client.stop()
+        srv.close()
+
+    assert not client.client_thread.is_alive()
+
+
+class CountingSocket:
+    """Socket wrapper counting ``recv_into`` calls."""
+    def __init__(self, sock):
+        self.sock = sock
+        self.reads = 0
+
+    def recv_into(self, *args):
+        self.reads += 1
+        return self.sock.recv_into(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.sock, name)
+
+
+@pytest.mark.parametrize("timeout, max_reads", [(None, 1), (5.0, None)])
+def test_recv_exactly_waitall_only_on_blocking_socket(timeout, max_reads):
+    ours, peer = socket.socketpair()
+    ours.settimeout(timeout)
+    client = Client()
+    client.client = CountingSocket(ours)
+
+    def send_in_two_parts():
+        peer.sendall(b"01234")
+        time.sleep(0.05)
+        peer.sendall(b"56789")
+
+    sender = threading.Thread(target=send_in_two_parts)
+    sender.start()
+    try:
+        assert bytes(client._recv_exactly(10)) == b"0123456789"
+    finally:
+        sender.join()
+        ours.close()
+        peer.close()
+
+    if max_reads is not None:
+        assert client.client.reads <= max_reads
+
+
+def test_pool_reuses_leased_clients():
+    srv = EchoServer()
+    pool = ClientPool(port=srv.port, size=2)
+    try:
+        with pool.lease() as first:
+            assert first.rpc("echo", {"Message": "a"})[1]["result"]["Message"] == "a"
+            with pool.lease() as second:
+                assert second is not first
+                with pytest.raises(TimeoutError):
+                    pool.get(timeout=0.05)
+        with pool.lease() as again:
+            assert again in (first, second)
+        assert srv.connections == 2
+    finally:
+        pool.close()
+        srv.close()
+
+    assert not first.connected and not second.connected
+    assert pool._created == 0
+
+
+def test_pool_close_keeps_config_and_closes_leased_clients():
+    srv = EchoServer()
+    pool = ClientPool(port=srv.port, size=2, max_rpcs_per_conn=10)
+    try:
+        idle = pool.get()
+        leased = pool.get()
+        pool.put(idle)
+        pool.close()
+
+        assert pool.max_rpcs_per_conn == 10
+        assert not idle.connected and leased.connected
+        pool.put(leased)
+        assert not leased.connected
+        assert pool._created == 0 and pool._uses == {}
+    finally:
+        srv.close()
+
+
+def test_pool_serves_concurrent_threads():
+    srv = EchoServer()
+    pool = ClientPool(port=srv.port, size=4)
+    results, errors = {}, []
+
+    def worker(n):
+        try:
+            for i in range(20):
+                message = f"{n}-{i}"
+                size, response, tail = pool.rpc("echo", {"Message": message})
+                assert tail == EXEC_TIME
+                results[message] = response["result"]["Message"]
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        pool.close()
+        srv.close()
+
+    assert errors == []
+    assert len(results) == 160 and all(k == v for k, v in results.items())
+    assert srv.connections <= 4
+
+
+def test_pool_rotates_connections():
+    srv = EchoServer()
+    pool = ClientPool(port=srv.port, size=1, max_rpcs_per_conn=2)
+    try:
+        for i in range(5):
+            pool.rpc("echo", {"Message": str(i)})
+    finally:
+        pool.close()
+        srv.close()
+
+    assert srv.connections == 3
+
+
+def test_pool_replaces_connection_closed_by_server():
+    srv = EchoServer(replies_per_conn=1)
+    pool = ClientPool(port=srv.port, size=1)
+    try:
+        assert pool.rpc("echo", {"Message": "first"})[2] == EXEC_TIME
+        with pytest.raises(ConnectionError):
+            pool.rpc("echo", {"Message": "lost"})
+        assert pool.rpc("echo", {"Message": "again"})[1]["result"]["Message"] == "again"
+    finally:
+        pool.close()
+        srv.close()
+
+    assert srv.connections == 2
+
+
+def test_async_client_matches_out_of_order_responses():
+    srv = EchoServer(batch=5)
+
+    async def main():
+        async with AsyncClient(port=srv.port) as client:
+            messages = [f"message {i}" * (i + 1) for i in range(20)]
+            return messages, await asyncio.gather(*(client.rpc("echo", {"Message": m}) for m in messages))
+
+    try:
+        messages, results = asyncio.run(main())
+    finally:
+        srv.close()
+
+    assert [response["result"]["Message"] for _, response, _ in results] == messages
+    assert all(tail == EXEC_TIME for _, _, tail in results)
+
+
+def test_async_client_drops_late_reply_after_timeout():
+    delays = [0.7]  # Only the first reply is late
+
+    def reply(body):
+        if delays:
+            time.sleep(delays.pop())
+        return body
+
+    srv = EchoServer(reply=reply)
+
+    async def main():
+        async with AsyncClient(port=srv.port, timeout=0.5) as client:
+            with pytest.raises(TimeoutError):
+                await client.rpc("echo", {"Message": "slow"})
+            # Still pending when the late reply to "slow" arrives
+            result = await client.rpc("echo", {"Message": "fast"})
+            return result, client._pending
+
+    try:
+        (size, response, tail), pending = asyncio.run(main())
+    finally:
+        srv.close()
+
+    assert response["result"]["Message"] == "fast"
+    assert pending == {}
+
+
+def test_async_client_decodes_mixed_layouts():
+    srv = EchoServer(batch=4)
+
+    async def main():
+        async with AsyncClient(port=srv.port) as client:
+            return await asyncio.gather(
+                client.rpc("echo", {"Message": "text"}),
+                client.rpc("echo", {"Message": 42}),
+                client.rpc("Display Text", {"Message": "other method"}),
+                client.rpc("echo", {"Message": 1.5}),
+            )
+
+    try:
+        results = asyncio.run(main())
+    finally:
+        srv.close()
+
+    assert [response["result"]["Message"] for _, response, _ in results] == ["text", 42, "other method", 1.5]
+
+
+def test_async_client_reconnects_after_server_closes():
+    srv = EchoServer(replies_per_conn=1)
+
+    async def main():
+        client = AsyncClient(port=srv.port)
+        await client.connect()
+        try:
+            assert (await client.rpc("echo", {"Message": "first"}))[2] == EXEC_TIME
+            with pytest.raises(ConnectionError):
+                await client.rpc("echo", {"Message": "lost"})
+            assert not client.connected
+
+            await client.disconnect()
+            await client.connect()
+            return await client.rpc("echo", {"Message": "again"})
+        finally:
+            await client.disconnect()
+
+    try:
+        size, response, tail = asyncio.run(main())
+    finally:
+        srv.close()
+
+    assert response["result"]["Message"] == "again"
+    assert srv.connections == 2
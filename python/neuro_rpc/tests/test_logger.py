@@ -0,0 +1,169 @@
+import gc
+import io
+import logging
+import os
+import queue
+import subprocess
+import sys
+import textwrap
+import weakref
+from pathlib import Path
+
+import pytest
+
+from python.neuro_rpc.Logger import BufferedStreamHandler, Logger, LoggerQueueHandler, LogListener
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+def run_python(code, stdout):
+    """Run ``code`` in a fresh interpreter with the repository importable."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    return subprocess.run([sys.executable, "-c", textwrap.dedent(code)], cwd=ROOT, env=env,
+                          stdout=stdout, stderr=subprocess.PIPE, text=True, timeout=60)
+
+
+@pytest.mark.parametrize("wrap_with_colorama", [False, True])
+def test_log_stream_is_buffered_on_file_stdout(tmp_path, wrap_with_colorama):
+    out = tmp_path / "out.txt"
+    code = f"""
+        import io, sys
+        if {wrap_with_colorama}:
+            import colorama
+            colorama.init(autoreset=True)  # Replaces sys.stdout with a StreamWrapper
+        from python.neuro_rpc.Logger import get_log_stream, BUFFER_SIZE, Logger
+        stream = get_log_stream()
+        assert stream is not sys.stdout, stream
+        assert isinstance(stream, io.TextIOWrapper), stream
+        assert stream.buffer.raw.fileno() == sys.__stdout__.fileno()
+        Logger.get_logger("stream-test").info("hello from the buffered stream")
+    """
+    with open(out, "w") as f:
+        proc = run_python(code, f)
+
+    assert proc.returncode == 0, proc.stderr
+    assert "hello from the buffered stream" in out.read_text()
+
+
+class ExplodingFormatter(logging.Formatter):
+    def format(self, record):
+        raise AssertionError("record formatted on the calling thread")
+
+
+def make_record(msg, args, level=logging.INFO):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+def test_queue_handler_does_not_format_on_caller():
+    q = queue.SimpleQueue()
+    target = BufferedStreamHandler(io.StringIO())
+    handler = LoggerQueueHandler(q, target)
+    handler.setFormatter(ExplodingFormatter())
+
+    handler.handle(make_record("value %d of %s", (3, "x")))
+    queued_target, _, record = q.get_nowait()
+
+    assert queued_target is target
+    assert (record.msg, record.args) == ("value %d of %s", (3, "x"))
+
+
+def test_queue_handler_merges_mutable_args():
+    q = queue.SimpleQueue()
+    handler = LoggerQueueHandler(q, BufferedStreamHandler(io.StringIO()))
+    items = [1, 2]
+
+    handler.handle(make_record("items %s", (items,)))
+    items.append(3)
+    _, _, record = q.get_nowait()
+
+    assert record.getMessage() == "items [1, 2]"
+
+
+def test_listener_respects_handler_level():
+    stream = io.StringIO()
+    target = BufferedStreamHandler(stream)
+    target.setLevel(logging.WARNING)
+    formatter = logging.Formatter("%(levelname)s %(message)s")
+    listener = LogListener(queue.SimpleQueue())
+
+    listener.handle((target, formatter, make_record("dropped", None, logging.INFO)))
+    listener.handle((target, formatter, make_record("kept", None, logging.WARNING)))
+
+    assert stream.getvalue() == "WARNING kept\n"
+
+
+def test_get_logger_is_idempotent_and_keeps_settings():
+    logger = Logger.get_logger("idempotent-test")
+    logger.setLevel(logging.WARNING)
+    logger_id = id(logger)
+    del logger
+    gc.collect()
+
+    again = Logger.get_logger("idempotent-test", level=logging.DEBUG)
+    assert id(again) == logger_id
+    assert again.level == logging.WARNING
+    assert sum(isinstance(h, LoggerQueueHandler) for h in again.handlers) == 1
+
+
+def test_release_frees_logger():
+    logger = Logger.get_logger("release-test")
+    ref = weakref.ref(logger)
+
+    assert Logger.release("release-test")
+    assert not Logger.release("release-test")
+    assert logger.handlers == []
+    del logger
+    gc.collect()
+
+    assert ref() is None
+    assert "release-test" not in logging.Logger.manager.loggerDict
+    assert Logger.get_logger("release-test") is not None
+
+
+def test_package_import_is_lazy():
+    code = """
+        import sys, threading
+        import python.neuro_rpc
+        import python.neuro_rpc.Client
+        assert "colorama" not in sys.modules
+        assert "logger" not in vars(python.neuro_rpc)
+        assert threading.active_count() == 1, threading.enumerate()
+
+        from python.neuro_rpc import logger
+        assert logger.name == "__neuro__"
+        assert logger is python.neuro_rpc.logger
+    """
+    proc = run_python(code, subprocess.PIPE)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_production_rate_filter_reaches_later_loggers():
+    code = """
+        from python.neuro_rpc.Logger import Logger, LoggerConfig
+        early = Logger.get_logger("early")
+        LoggerConfig.configure_for_production()
+        late = Logger.get_logger("late")
+        assert LoggerConfig.rate_filter in early.filters
+        assert LoggerConfig.rate_filter in late.filters
+
+        LoggerConfig.configure_for_development()
+        assert LoggerConfig.rate_filter not in late.filters
+        assert LoggerConfig.rate_filter not in Logger.get_logger("after").filters
+    """
+    proc = run_python(code, subprocess.PIPE)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_new_verbose_logger_keeps_context_capture_opt_out():
+    code = """
+        import logging
+        from python.neuro_rpc.Logger import Logger, LoggerConfig
+        LoggerConfig.configure_for_production()
+        Logger.get_logger("verbose-after-production", verbose=True)
+        assert not logging.logThreads and not logging.logProcesses
+
+        LoggerConfig.configure_for_development()
+        assert logging.logThreads and logging.logProcesses
+    """
+    proc = run_python(code, subprocess.PIPE)
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,40 @@
+import uuid
+
+import pytest
+
+from python.neuro_rpc.Proxy import Proxy
+
+UUID_ID = "6b371397-9fbe-4d90-9283-6aec836abe68"
+
+
+def request(request_id, message="hi"):
+    return {"jsonrpc": "2.0", "method": "echo reply", "id": request_id, "params": {"Message": message}}
+
+
+STRING_IDS = [
+    UUID_ID,
+    "req-1",
+    "0123456789abcdef",  # 16 characters, like raw UUID bytes
+    UUID_ID.upper(),     # Parses as a UUID but does not round-trip
+    "{" + UUID_ID + "}",
+]
+
+
+@pytest.mark.parametrize("id_mode, request_id",
+                         [("ascii", i) for i in STRING_IDS] + [("bytes", i) for i in STRING_IDS + [7]])
+def test_act_round_trips_request_ids(id_mode, request_id):
+    proxy = Proxy(id_mode=id_mode)
+
+    buf, hdr_tree = proxy.to_act(request(request_id))
+    response = proxy.from_act(buf, hdr_tree)
+
+    assert response["id"] == request_id and type(response["id"]) is type(request_id)
+    assert response["result"]["Message"] == "hi"
+
+
+def test_bytes_mode_sends_raw_uuid():
+    ascii_buf, _ = Proxy().to_act(request(UUID_ID))
+    bytes_buf, _ = Proxy(id_mode="bytes").to_act(request(UUID_ID))
+
+    assert uuid.UUID(UUID_ID).bytes in bytes_buf
+    assert len(ascii_buf) - len(bytes_buf) == 36 - 16
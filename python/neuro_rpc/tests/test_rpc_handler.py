@@ -0,0 +1,159 @@
+import inspect
+
+import pytest
+
+from python.neuro_rpc.RPCHandler import RPCHandler
+
+
+def baseline_dispatch(callback, params):
+    """Generic dispatch as done before the generated stubs (signature walk per call)."""
+    params = params or {}
+    sig = inspect.signature(callback)
+    required = [name for name, param in sig.parameters.items()
+                if param.default == inspect.Parameter.empty and name != 'self']
+    try:
+        if isinstance(params, dict):
+            missing = [name for name in required if name not in params]
+            if missing:
+                return "invalid", f"Missing required parameters: {', '.join(missing)}"
+            return "result", callback(**params)
+        if isinstance(params, list):
+            if len(params) < len(required):
+                return "invalid", f"Method requires {len(required)} positional arguments, got {len(params)}"
+            return "result", callback(*params)
+        return "result", callback()
+    except Exception as e:
+        return "internal", str(e)
+
+
+def outcome(response):
+    """Reduce a response dict to the ``baseline_dispatch`` form."""
+    if "result" in response:
+        return "result", response["result"]
+    kind = {-32602: "invalid", -32603: "internal"}[response["error"]["code"]]
+    return kind, response["error"].get("metadata")
+
+
+class Obj:
+    def bound(self, x, y=1):
+        return x * y
+
+
+def two(a, b):
+    return a - b
+
+
+def with_default(a, b=10):
+    return a + b
+
+
+def keyword_only(a, *, scale):
+    return a * scale
+
+
+def variadic(*args, **kwargs):
+    return [list(args), kwargs]
+
+
+def no_params():
+    return "none"
+
+
+def self_named(self, x):
+    return [self, x]
+
+
+HANDLERS = {
+    "two": two,
+    "with_default": with_default,
+    "keyword_only": keyword_only,
+    "variadic": variadic,
+    "no_params": no_params,
+    "self_named": self_named,
+    "bound": Obj().bound,
+}
+
+PARAMS = [
+    None,
+    {},
+    [],
+    {"a": 1},
+    {"a": 1, "b": 2},
+    {"a": 1, "b": 2, "extra": 3},
+    {"a": 3, "scale": 2},
+    {"x": 4},
+    {"x": 4, "y": 5},
+    {"self": 1, "x": 2},
+    {"args": 1, "kwargs": 2},
+    [1],
+    [1, 2],
+    [1, 2, 3],
+]
+
+
+@pytest.fixture(scope="module")
+def handler():
+    h = RPCHandler()
+    for name, method in HANDLERS.items():
+        h.register_request(name, method)
+    return h
+
+
+@pytest.mark.parametrize("params", PARAMS, ids=repr)
+@pytest.mark.parametrize("name", HANDLERS)
+def test_stub_matches_baseline_dispatch(handler, name, params):
+    response = handler.process_message({"jsonrpc": "2.0", "method": name, "params": params, "id": "t"})
+    assert outcome(response) == baseline_dispatch(HANDLERS[name], params)
+
+
+def test_stub_for_handler_set_directly(handler):
+    handler.request_methods["direct"] = with_default
+    response = handler.process_message({"jsonrpc": "2.0", "method": "direct", "params": [5], "id": "t"})
+    assert response["result"] == 15
+
+    handler.request_methods["direct"] = two  # Replaced: the stub must follow
+    response = handler.process_message({"jsonrpc": "2.0", "method": "direct", "params": [5], "id": "t"})
+    assert outcome(response) == ("invalid", "Method requires 2 positional arguments, got 1")
+
+
+@pytest.mark.parametrize("name", ["echo reply", "Display Text", "a-b", "1st", "x'; import os; '"])
+def test_register_request_accepts_wire_names(name):
+    h = RPCHandler()
+    h.register_request(name, two)
+    response = h.process_message({"jsonrpc": "2.0", "method": name, "params": [5, 2], "id": "t"})
+    assert response["result"] == 3
+
+    h.request_methods[name] = with_default  # Set directly under the same name
+    response = h.process_message({"jsonrpc": "2.0", "method": name, "params": {"a": 1}, "id": "t"})
+    assert response["result"] == 11
+
+
+def test_message_kinds_dispatch_through_subclass_overrides():
+    class Recording(RPCHandler):
+        def __init__(self):
+            super().__init__()
+            self.seen = []
+
+        def _dispatch_request(self, message):
+            self.seen.append(("request", message["id"]))
+            return super()._dispatch_request(message)
+
+        def _dispatch_response(self, message):
+            self.seen.append(("response", message["id"]))
+            return super()._dispatch_response(message)
+
+    h = Recording()
+    h.register_request("two", two)
+    assert h.process_message({"jsonrpc": "2.0", "method": "two", "params": [3, 1], "id": "q"})["result"] == 2
+    h.process_message({"jsonrpc": "2.0", "result": 1, "id": "r"})
+    h.process_message({"jsonrpc": "2.0", "error": {"code": 1, "message": "m"}, "id": "e"})
+
+    assert h.seen == [("request", "q"), ("response", "r"), ("response", "e")]
+
+
+def test_bad_message_kind_table_fails_at_construction():
+    class Broken(RPCHandler):
+        _MESSAGE_KINDS = {**RPCHandler._MESSAGE_KINDS, "result": "_dispatch_reponse"}
+
+    with pytest.raises(AttributeError):
+        Broken()